@@ -3,6 +3,8 @@ import tempfile
 import os
 from unittest.mock import patch, Mock
 
+from zombie_detector.core.processor import _load_kafka_config
+
 
 @pytest.fixture(autouse=True)
 def mock_zombie_tracker(request):
@@ -40,6 +42,14 @@ def mock_zombie_tracker(request):
             yield temp_dir
 
 
+@pytest.fixture(autouse=True)
+def clear_kafka_config_cache():
+    """Drop the cached Kafka config so each test reads its own patched file."""
+    _load_kafka_config.cache_clear()
+    yield
+    _load_kafka_config.cache_clear()
+
+
 @pytest.fixture
 def temp_data_dir():
     """Create a temporary directory for zombie tracking data."""
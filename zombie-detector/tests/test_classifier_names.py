@@ -7,6 +7,8 @@ from zombie_detector.core.classifier import (
     get_zombie_types_by_criteria_count,
     get_criteria_combinations,
     ALIAS_BY_CODE,
+    CRITERIA_KEYS,
+    VALID_CRITERION_TYPES,
 )
 
 
@@ -242,6 +244,29 @@ class TestZombieClassifierNames:
         assert first_result[0] == "2B"  # CPU + Sustained Low CPU
         assert first_result[1] == "Wraith"
 
+    def test_every_criteria_combination_has_distinct_code(self):
+        """Test that all 32 criteria combinations map to 32 distinct codes."""
+        codes = set()
+        for mask in range(32):
+            host = {key: (mask >> i) & 1 for i, key in enumerate(CRITERIA_KEYS)}
+            code, _, _ = classify_host(host)
+            assert code.startswith(str(bin(mask).count("1")))
+            codes.add(code)
+
+        assert codes == VALID_CRITERION_TYPES
+
+    def test_non_integer_criteria_values(self):
+        """Test that only values that truncate to 1 count as active."""
+        host = {
+            "Recent_CPU_decrease_criterion": "1",
+            "Recent_net_traffic_decrease_criterion": 1.5,
+            "Sustained_Low_CPU_criterion": "x",
+            "Excessively_constant_RAM_criterion": None,
+            "Daily_CPU_profile_lost_criterion": -1,
+        }
+
+        assert classify_host(host)[0] == "2A"
+
 
 class TestZombieClassificationIntegration:
     """Test integration with the rest of the system."""
@@ -274,6 +299,27 @@ class TestZombieClassificationIntegration:
         assert result["criterion_alias"] == "Mummy"
         assert result["is_zombie"] == True
 
+    def test_processor_matches_classify_host(self):
+        """Test that the processor and classify_host agree on every combination."""
+        from zombie_detector.core.processor import process_host_data
+
+        hosts = [
+            {key: (mask >> i) & 1 for i, key in enumerate(CRITERIA_KEYS)}
+            for mask in range(32)
+        ]
+        state_map = {code: 1 for code in VALID_CRITERION_TYPES}
+
+        results = process_host_data(
+            hosts, state_map, enable_tracking=False, enable_kafka=False
+        )
+
+        for host, result in zip(hosts, results):
+            assert (
+                result["criterion_type"],
+                result["criterion_alias"],
+                result["criterion_description"],
+            ) == classify_host(host)
+
     def test_api_response_format(self):
         """Test that API responses include the new zombie names."""
         from zombie_detector.api.rest import DetectionResponse
@@ -1,14 +1,30 @@
+import json
 import pytest
 import tempfile
 import os
 import configparser
 from unittest.mock import patch
 from zombie_detector.core.processor import _load_kafka_config
+from zombie_detector.core.state_loader import (
+    DEFAULT_CRITERION_TYPE_STATES,
+    load_criterion_type_states,
+)
 
 
 class TestKafkaConfig:
     """Test Kafka configuration loading functionality."""
 
+    def test_load_kafka_config_is_cached(self):
+        """Test that the config file is only read once per process."""
+        with patch(
+            "zombie_detector.core.processor.os.path.exists", return_value=False
+        ) as mock_exists:
+            first = _load_kafka_config()
+            second = _load_kafka_config()
+
+        assert first is second
+        mock_exists.assert_called_once()
+
     def test_load_kafka_config_file_not_exists(self):
         """Test loading config when file doesn't exist."""
         with patch("zombie_detector.core.processor.os.path.exists", return_value=False):
@@ -62,7 +78,7 @@ acks = all
                 "compression_type": "gzip",
                 "retries": 5,
                 "acks": "all",
-                "batch_size": 16384,
+                "batch_size": 786432,
                 "linger_ms": 100,
                 "buffer_memory": 33554432,
             }
@@ -118,7 +134,7 @@ bootstrap_servers = localhost:9092
             "compression_type": "gzip",
             "retries": 3,
             "acks": "all",
-            "batch_size": 16384,
+            "batch_size": 786432,
             "linger_ms": 100,
             "buffer_memory": 33554432,
         }
@@ -168,7 +184,7 @@ sasl_plain_password = secure-password
             "compression_type": "gzip",
             "retries": 3,
             "acks": "all",
-            "batch_size": 16384,
+            "batch_size": 786432,
             "linger_ms": 100,
             "buffer_memory": 33554432,
             "ssl_config": {
@@ -214,7 +230,7 @@ ssl_check_hostname = false
             "compression_type": "gzip",
             "retries": 3,
             "acks": "all",
-            "batch_size": 16384,
+            "batch_size": 786432,
             "linger_ms": 100,
             "buffer_memory": 33554432,
             "ssl_config": {
@@ -256,7 +272,7 @@ sasl_password = super-secure-password
             "compression_type": "gzip",
             "retries": 3,
             "acks": "all",
-            "batch_size": 16384,
+            "batch_size": 786432,
             "linger_ms": 100,
             "buffer_memory": 33554432,
             "sasl_config": {
@@ -296,7 +312,7 @@ ssl_cafile = /etc/ssl/ca.pem
             "compression_type": "gzip",
             "retries": 3,
             "acks": "all",
-            "batch_size": 16384,
+            "batch_size": 786432,
             "linger_ms": 100,
             "buffer_memory": 33554432,
             "ssl_config": {
@@ -334,7 +350,7 @@ sasl_mechanism = PLAIN
             "compression_type": "gzip",
             "retries": 3,
             "acks": "all",
-            "batch_size": 16384,
+            "batch_size": 786432,
             "linger_ms": 100,
             "buffer_memory": 33554432,
             "sasl_config": {
@@ -602,3 +618,64 @@ sasl_oauth_client_id = my-client
             assert field in supported_sasl_fields, (
                 f"Unsupported SASL field found: {field}"
             )
+
+
+class TestStateLoader:
+    """Test criterion type state loading."""
+
+    def test_missing_state_file_returns_defaults(self, tmp_path):
+        """Test that a missing state file falls back to the defaults."""
+        states = load_criterion_type_states(str(tmp_path / "missing.json"))
+
+        assert states == DEFAULT_CRITERION_TYPE_STATES
+        assert isinstance(states, dict)
+
+    def test_state_file_is_parsed_once_until_modified(self, tmp_path):
+        """Test that unchanged state files are served from the cache."""
+        state_path = tmp_path / "states.json"
+        state_path.write_text('{"2A": 1}')
+
+        with patch(
+            "zombie_detector.core.state_loader.json.load", wraps=json.load
+        ) as mock_load:
+            first = load_criterion_type_states(str(state_path))
+            second = load_criterion_type_states(str(state_path))
+
+            assert first == second == {"2A": 1}
+            assert mock_load.call_count == 1
+
+            # A same-size replacement with an identical mtime is still detected
+            before = os.stat(state_path)
+            replacement = tmp_path / "states.json.new"
+            replacement.write_text('{"2A": 0}')
+            os.replace(replacement, state_path)
+            os.utime(state_path, ns=(before.st_atime_ns, before.st_mtime_ns))
+            third = load_criterion_type_states(str(state_path))
+
+        assert third == {"2A": 0}
+        assert mock_load.call_count == 2
+
+    def test_returned_states_do_not_alias_the_cache(self, tmp_path):
+        """Test that mutating returned states does not leak into later calls."""
+        state_path = tmp_path / "states.json"
+        state_path.write_text('{"2A": 1}')
+
+        states = load_criterion_type_states(str(state_path))
+        states["2A"] = 0
+
+        assert isinstance(states, dict)
+        assert load_criterion_type_states(str(state_path)) == {"2A": 1}
+
+    def test_invalid_state_file_is_not_cached(self, tmp_path):
+        """Test that a parse failure falls back to defaults without being cached."""
+        state_path = tmp_path / "states.json"
+        state_path.write_text("{not json")
+
+        with patch(
+            "zombie_detector.core.state_loader.json.load", wraps=json.load
+        ) as mock_load:
+            first = load_criterion_type_states(str(state_path))
+            second = load_criterion_type_states(str(state_path))
+
+        assert first == second == DEFAULT_CRITERION_TYPE_STATES
+        assert mock_load.call_count == 2
@@ -2,11 +2,14 @@
 # filepath: zombie-detector/tests/test_detection.py
 import pytest
 import json
+import math
 import tempfile
 import os
+from unittest.mock import patch
 from zombie_detector import process_zombies
 from zombie_detector.core.classifier import classify_host
 from zombie_detector.core.processor import process_host_data
+from zombie_detector.utils.utils import iter_host_data, load_host_data
 
 
 class TestZombieDetection:
@@ -142,6 +145,112 @@ class TestZombieDetection:
             os.unlink(data_path)
             os.unlink(state_path)
 
+    def test_load_host_data_without_orjson(self):
+        """Test that host data loads the same with the stdlib json fallback"""
+        example_data = [
+            {
+                "dynatrace_host_id": "HOST-1",
+                "hostname": "hostname1",
+                "Recent_CPU_decrease_criterion": 1,
+                "Sustained_Low_CPU_criterion": 0.5,
+            }
+        ]
+
+        with tempfile.NamedTemporaryFile(mode="w", suffix=".json", delete=False) as f:
+            json.dump(example_data, f)
+            data_path = f.name
+
+        try:
+            with patch("zombie_detector.utils.utils._json_loads", json.loads):
+                fallback = load_host_data(data_path)
+            assert fallback == example_data
+            assert load_host_data(data_path) == example_data
+        finally:
+            os.unlink(data_path)
+
+    def test_load_host_data_accepts_nan_literals(self):
+        """Test that NaN/Infinity literals load with and without orjson"""
+        with tempfile.NamedTemporaryFile(mode="w", suffix=".json", delete=False) as f:
+            f.write(
+                '[{"dynatrace_host_id": "HOST-1", '
+                '"Sustained_Low_CPU_criterion": NaN, '
+                '"Recent_CPU_decrease_criterion": Infinity}]'
+            )
+            data_path = f.name
+
+        try:
+            with patch("zombie_detector.utils.utils._json_loads", json.loads):
+                fallback = load_host_data(data_path)
+            loaded = load_host_data(data_path)
+            streamed = list(iter_host_data(data_path))
+
+            for hosts in (fallback, loaded, streamed):
+                assert hosts[0]["dynatrace_host_id"] == "HOST-1"
+                assert math.isnan(hosts[0]["Sustained_Low_CPU_criterion"])
+                assert hosts[0]["Recent_CPU_decrease_criterion"] == math.inf
+        finally:
+            os.unlink(data_path)
+
+    def test_iter_host_data_parses_small_files_in_one_go(self):
+        """Test that files below the streaming threshold skip ijson"""
+        example_data = [
+            {"dynatrace_host_id": "HOST-1"},
+            {"dynatrace_host_id": "HOST-2"},
+        ]
+
+        with tempfile.NamedTemporaryFile(mode="w", suffix=".json", delete=False) as f:
+            json.dump(example_data, f)
+            data_path = f.name
+
+        try:
+            with patch("zombie_detector.utils.utils.ijson", None):
+                assert list(iter_host_data(data_path)) == example_data
+
+            with patch("zombie_detector.utils.utils.ijson") as mock_ijson:
+                assert list(iter_host_data(data_path)) == example_data
+            mock_ijson.parse.assert_not_called()
+        finally:
+            os.unlink(data_path)
+
+    def test_iter_host_data_rejects_non_array(self):
+        """Test that a top-level object is an error rather than zero hosts"""
+        with tempfile.NamedTemporaryFile(mode="w", suffix=".json", delete=False) as f:
+            json.dump({"hosts": [{"dynatrace_host_id": "HOST-1"}]}, f)
+            data_path = f.name
+
+        try:
+            with pytest.raises(ValueError, match="JSON array"):
+                list(iter_host_data(data_path))
+        finally:
+            os.unlink(data_path)
+
+    def test_iter_host_data_streams_with_ijson(self):
+        """Test streaming a real file through ijson above the threshold"""
+        pytest.importorskip("ijson")
+        example_data = [
+            {"dynatrace_host_id": "HOST-1", "Sustained_Low_CPU_criterion": 0.5},
+            {"dynatrace_host_id": "HOST-2", "Sustained_Low_CPU_criterion": 1},
+        ]
+
+        with tempfile.NamedTemporaryFile(mode="w", suffix=".json", delete=False) as f:
+            json.dump(example_data, f)
+            data_path = f.name
+        with tempfile.NamedTemporaryFile(mode="w", suffix=".json", delete=False) as f:
+            json.dump({"hosts": example_data}, f)
+            bad_path = f.name
+
+        try:
+            with patch("zombie_detector.utils.utils.STREAM_MIN_BYTES", 0):
+                hosts = list(iter_host_data(data_path))
+                with pytest.raises(ValueError, match="JSON array"):
+                    list(iter_host_data(bad_path))
+
+            assert hosts == example_data
+            assert isinstance(hosts[0]["Sustained_Low_CPU_criterion"], float)
+        finally:
+            os.unlink(data_path)
+            os.unlink(bad_path)
+
     def test_process_with_disabled_tracking(self):
         """Test processing with tracking disabled"""
 
@@ -267,6 +267,27 @@ class TestKafkaAuthentication:
         assert health["security_protocol"] == "PLAINTEXT"
         assert health["connected"] == True
 
+    @patch("zombie_detector.core.zombie_publisher.KafkaProducer")
+    def test_kafka_publisher_health_check_is_cached(self, mock_kafka_producer):
+        """Test repeated health checks within the TTL reuse the last probe."""
+        mock_producer = Mock()
+        mock_producer.bootstrap_connected.return_value = True
+        mock_kafka_producer.return_value = mock_producer
+
+        publisher = ZombieKafkaPublisher(bootstrap_servers="localhost:9092")
+
+        with patch("zombie_detector.core.zombie_publisher.time.monotonic") as clock:
+            clock.return_value = 100.0
+            first = publisher.health_check()
+            clock.return_value = 100.5
+            second = publisher.health_check()
+            assert mock_producer.bootstrap_connected.call_count == 1
+            assert first == second
+
+            clock.return_value = 101.5
+            publisher.health_check()
+            assert mock_producer.bootstrap_connected.call_count == 2
+
     @patch("zombie_detector.core.zombie_publisher.KafkaProducer")
     def test_kafka_publisher_health_check_failed(self, mock_kafka_producer):
         """Test Kafka publisher health check when connection fails."""
@@ -20,6 +20,7 @@ class TestZombieKafkaPublisher:
         assert publisher.topic_prefix == "test-zombie"
         assert publisher.security_protocol == "PLAINTEXT"
         assert publisher.producer == mock_producer
+        assert not hasattr(publisher, "__dict__")
 
         mock_kafka_producer.assert_called_once_with(
             bootstrap_servers="localhost:9092",
@@ -28,7 +29,7 @@ class TestZombieKafkaPublisher:
             retries=3,
             acks="all",
             compression_type="gzip",
-            batch_size=16384,
+            batch_size=786432,
             linger_ms=100,
             buffer_memory=33554432,
             security_protocol="PLAINTEXT",
@@ -67,6 +68,48 @@ class TestZombieKafkaPublisher:
         assert mock_producer.send.call_count >= 2
         mock_producer.flush.assert_called_once()
 
+    @patch("zombie_detector.core.zombie_publisher.KafkaProducer")
+    def test_publish_detection_registers_errbacks(self, mock_kafka_producer, caplog):
+        """Test that delivery failures are handled through send futures."""
+        mock_producer = Mock()
+        mock_kafka_producer.return_value = mock_producer
+
+        publisher = ZombieKafkaPublisher(topic_prefix="test-zombie")
+        publisher.publish_zombie_detection(
+            [{"dynatrace_host_id": "HOST-1"}, {"dynatrace_host_id": "HOST-2"}]
+        )
+
+        # One summary message plus one message per host
+        future = mock_producer.send.return_value
+        assert future.add_errback.call_count == 3
+        mock_producer.flush.assert_called_once_with(timeout=ANY)
+
+        errback, topic = future.add_errback.call_args[0]
+        errback(topic, Exception("broker down"))
+        assert "test-zombie-detections" in caplog.text
+        assert "broker down" in caplog.text
+
+    @patch("zombie_detector.core.zombie_publisher.KafkaProducer")
+    def test_publish_uses_prefixed_topics(self, mock_kafka_producer):
+        """Test that every stream is published to its prefixed topic."""
+        mock_producer = Mock()
+        mock_kafka_producer.return_value = mock_producer
+
+        publisher = ZombieKafkaPublisher(topic_prefix="test-zombie")
+
+        publisher.publish_zombie_detection([{"dynatrace_host_id": "HOST-1"}])
+        publisher.publish_tracking_stats({"new_zombies": []})
+        publisher.publish_zombie_lifecycle_event(
+            "zombie_new", {"dynatrace_host_id": "HOST-1"}
+        )
+
+        topics = {call.args[0] for call in mock_producer.send.call_args_list}
+        assert topics == {
+            "test-zombie-detections",
+            "test-zombie-tracking",
+            "test-zombie-lifecycle",
+        }
+
     @patch("zombie_detector.core.zombie_publisher.KafkaProducer")
     def test_publish_lifecycle_event(self, mock_kafka_producer):
         """Test publishing zombie lifecycle events."""
@@ -86,6 +129,25 @@ class TestZombieKafkaPublisher:
         mock_producer.send.assert_called_once()
         mock_producer.flush.assert_called_once()
 
+    @patch("zombie_detector.core.zombie_publisher.KafkaProducer")
+    def test_tracking_and_lifecycle_register_errbacks(self, mock_kafka_producer):
+        """Test that every topic reports failures and bounds its flush."""
+        mock_producer = Mock()
+        mock_kafka_producer.return_value = mock_producer
+
+        publisher = ZombieKafkaPublisher(topic_prefix="test-zombie")
+        publisher.publish_tracking_stats({"new_zombies": []})
+        publisher.publish_zombie_lifecycle_event(
+            "zombie_new", {"dynatrace_host_id": "HOST-1"}
+        )
+
+        future = mock_producer.send.return_value
+        topics = [call.args[1] for call in future.add_errback.call_args_list]
+        assert topics == ["test-zombie-tracking", "test-zombie-lifecycle"]
+        assert mock_producer.flush.call_count == 2
+        for call in mock_producer.flush.call_args_list:
+            assert call.kwargs["timeout"] is not None
+
     @patch("zombie_detector.core.zombie_publisher.KafkaProducer")
     def test_get_criterion_breakdown(self, mock_kafka_producer):
         """Test criterion breakdown calculation."""
@@ -107,6 +169,12 @@ class TestZombieKafkaPublisher:
 
         expected = {"2A": 2, "1A": 1, "unknown": 1}
         assert breakdown == expected
+        assert type(breakdown) is dict
+
+        publisher.publish_zombie_detection(zombies)
+        summary = mock_producer.send.call_args_list[0][1]["value"]
+        assert summary["zombie_hosts"] == 4
+        assert summary["criterion_breakdown"] == expected
 
     @patch("zombie_detector.core.zombie_publisher.KafkaProducer")
     def test_close_producer(self, mock_kafka_producer):
@@ -127,19 +195,40 @@ class TestZombieKafkaPublisher:
         publisher = ZombieKafkaPublisher()
 
         # Test value serializer
-        test_data = {"timestamp": datetime.now(), "count": 5}
-        # This should not raise an exception
-        serialized = json.dumps(test_data, default=str).encode("utf-8")
+        test_data = {"timestamp_ms": 1745400000000, "count": 5}
+        serialized = publisher._value_serializer(test_data)
         assert isinstance(serialized, bytes)
+        assert json.loads(serialized) == test_data
+        assert b" " not in serialized
+
+        # Non-JSON types are rejected rather than stringified
+        with pytest.raises(TypeError):
+            publisher._value_serializer({"timestamp": datetime.now()})
 
         # Test key serializer
-        key = "test-key"
-        serialized_key = key.encode("utf-8")
-        assert isinstance(serialized_key, bytes)
+        assert publisher._key_serializer("test-key") == b"test-key"
 
         # Test None key
-        none_key = None
-        assert none_key is None
+        assert publisher._key_serializer(None) is None
+
+    @patch("zombie_detector.core.zombie_publisher.KafkaProducer")
+    def test_payload_timestamps_keep_iso_field(self, mock_kafka_producer):
+        """Test that payloads keep the ISO timestamp and add epoch-ms."""
+        mock_producer = Mock()
+        mock_kafka_producer.return_value = mock_producer
+
+        publisher = ZombieKafkaPublisher()
+        publisher.publish_zombie_detection([])
+        publisher.publish_tracking_stats({"new_zombies": []})
+        publisher.publish_zombie_lifecycle_event(
+            "zombie_new", {"dynatrace_host_id": "HOST-1"}
+        )
+
+        for call in mock_producer.send.call_args_list:
+            payload = call.kwargs["value"]
+            assert isinstance(payload["timestamp_ms"], int)
+            parsed = datetime.fromisoformat(payload["timestamp"])
+            assert abs(parsed.timestamp() * 1000 - payload["timestamp_ms"]) <= 1
 
     def test_kafka_unavailable_initialization(self):
         """Test publisher initialization when Kafka is unavailable."""
@@ -182,14 +271,25 @@ class TestZombieKafkaPublisher:
     @patch("zombie_detector.core.zombie_publisher.KafkaProducer")
     def test_publish_with_no_producer(self, mock_kafka_producer):
         """Test publishing when producer is None."""
-        mock_kafka_producer.return_value = Mock()
+        mock_producer = Mock()
+        mock_kafka_producer.return_value = mock_producer
 
         publisher = ZombieKafkaPublisher()
         publisher.producer = None  # Simulate failed initialization
 
         detection_results = [{"dynatrace_host_id": "HOST-1", "is_zombie": True}]
 
-        # Should not raise exception
-        publisher.publish_zombie_detection(detection_results)
-        publisher.publish_tracking_stats({"total": 1})
-        publisher.publish_zombie_lifecycle_event("new", {"host": "HOST-1"})
+        # Should not raise exception, nor build or serialize any payload
+        with (
+            patch("zombie_detector.core.zombie_publisher._encode_json") as mock_dumps,
+            patch.object(
+                ZombieKafkaPublisher, "_get_criterion_breakdown"
+            ) as mock_breakdown,
+        ):
+            publisher.publish_zombie_detection(detection_results)
+            publisher.publish_tracking_stats({"total": 1})
+            publisher.publish_zombie_lifecycle_event("new", {"host": "HOST-1"})
+
+        assert mock_dumps.call_count == 0
+        mock_breakdown.assert_not_called()
+        mock_producer.send.assert_not_called()
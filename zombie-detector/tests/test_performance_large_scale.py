@@ -6,37 +6,115 @@ Performance benchmarking suite for generating documentation graphs.
 This module creates standardized performance graphs for documentation purposes,
 focusing on key metrics that demonstrate system capabilities and scalability.
 
+Memory figures come from tracemalloc, which only counts allocations made while
+tracing, so the benchmarks can share one process without earlier runs (cached
+datasets, matplotlib, psutil state) inflating later measurements.
+
 Usage:
     pytest tests/test_performance_benchmarks.py -v -s --tb=short
     python tests/test_performance_benchmarks.py  # Direct execution for graph generation
+    pytest -n auto --dist loadgroup  # With pytest-xdist, benchmarks share a worker
+    ZOMBIE_BENCH_RENDER=0 pytest tests/test_performance_benchmarks.py  # Skip graphs
 """
 
 import pytest
 import time
 import json
-import statistics
 import tempfile
 import os
 import gc
-import threading
-import queue
-import random
-from typing import List, Dict, Tuple
+import functools
+import tracemalloc
+from operator import eq, itemgetter
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import Dict, Iterator, List, Optional, Tuple
 from unittest.mock import Mock, patch
-import matplotlib.pyplot as plt
-import matplotlib.patches as mpatches
 import numpy as np
 from datetime import datetime
 import psutil
-import seaborn as sns
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 from zombie_detector.core.processor import process_host_data
 from zombie_detector.core.zombie_publisher import ZombieKafkaPublisher
 from zombie_detector import process_zombies
 
-# Set style for consistent, professional graphs
-plt.style.use("seaborn-v0_8-whitegrid")
-sns.set_palette("husl")
+# Fixed seed so runs are reproducible and repeated (size, ratio) requests can
+# share one generated dataset; override with ZOMBIE_BENCH_SEED
+BENCH_SEED = int(os.getenv("ZOMBIE_BENCH_SEED", "20250423"))
+
+# Realistic zombie criteria patterns, one row per pattern, with their weights
+_ZOMBIE_PATTERNS = np.array(
+    [
+        # Single criteria (60% of zombies)
+        [1, 0, 0, 0, 0],  # CPU decrease only
+        [0, 1, 0, 0, 0],  # Network decrease only
+        [0, 0, 1, 0, 0],  # Sustained low CPU only
+        [0, 0, 0, 1, 0],  # Constant RAM only
+        # Double criteria (30% of zombies)
+        [1, 1, 0, 0, 0],  # CPU + Network (most critical)
+        [1, 0, 1, 0, 0],  # CPU + Sustained CPU
+        [1, 0, 0, 1, 0],  # CPU + RAM
+        # Triple+ criteria (10% of zombies)
+        [1, 1, 1, 0, 0],  # CPU + Network + Sustained
+        [1, 1, 1, 1, 0],  # Quad criteria
+    ],
+    dtype=np.int8,
+)
+_ZOMBIE_PATTERN_WEIGHTS = np.array(
+    [0.25, 0.15, 0.15, 0.05, 0.15, 0.10, 0.05, 0.08, 0.02]
+)
+_ZOMBIE_PATTERN_WEIGHTS /= _ZOMBIE_PATTERN_WEIGHTS.sum()
+
+
+def _json_bytes(obj) -> bytes:
+    """Serialize benchmark fixtures, preferring orjson when it is installed."""
+    if orjson is not None:
+        return orjson.dumps(obj)
+    return json.dumps(obj).encode("utf-8")
+
+
+def _zombie_count(results: List[Dict]) -> int:
+    """Count zombie rows without a per-row generator frame."""
+    return sum(map(itemgetter("is_zombie"), results))
+
+
+# seaborn's six-colour "husl" palette, applied without importing seaborn
+_HUSL_PALETTE = ["#f77189", "#bb9832", "#50b131", "#36ada4", "#3ba3ec", "#e866f4"]
+
+# Every graph is drawn on the same 2x2 figure, cleared between reports. It is
+# built lazily so matplotlib is only imported once the first graph is drawn.
+_report_figure = None
+_report_axes = None
+
+
+def _lazy_report_axes():
+    """Return the shared report figure and its axes grid, ready to draw on.
+
+    The figure is rendered through its own Agg canvas rather than pyplot, so
+    no backend or global figure registry is involved.
+    """
+    global _report_figure, _report_axes
+    if _report_figure is None:
+        import matplotlib
+        import matplotlib.style
+        from matplotlib.backends.backend_agg import FigureCanvasAgg
+        from matplotlib.figure import Figure
+
+        # Set style for consistent, professional graphs
+        matplotlib.style.use("seaborn-v0_8-whitegrid")
+        matplotlib.rcParams["axes.prop_cycle"] = matplotlib.cycler(color=_HUSL_PALETTE)
+
+        _report_figure = Figure(figsize=(16, 12), layout="constrained")
+        FigureCanvasAgg(_report_figure)
+        _report_axes = _report_figure.subplots(2, 2)
+    else:
+        for ax in _report_axes.flat:
+            ax.clear()
+    return _report_figure, _report_axes
 
 
 class PerformanceBenchmarkSuite:
@@ -45,12 +123,23 @@ class PerformanceBenchmarkSuite:
     def __init__(self):
         """Initialize benchmark suite with consistent settings."""
         self.output_dir = "zombie-detector/docs/_static"
-        os.makedirs(self.output_dir, exist_ok=True)
+
+        # Set ZOMBIE_BENCH_RENDER=0 to only measure, without drawing graphs
+        self.render_graphs = os.getenv("ZOMBIE_BENCH_RENDER", "1") == "1"
+        if self.render_graphs:
+            os.makedirs(self.output_dir, exist_ok=True)
+        # Raise (e.g. suite.dpi = 300) for release-quality exports
+        self.dpi = 100
 
         # Standard test parameters
         self.dataset_sizes = [1000, 2500, 5000, 10000, 25000]
         self.concurrency_levels = [1, 5, 10, 20, 50]
+        self.cli_test_sizes = [1000, 2500, 5000]  # Smaller sizes for CLI testing
         self.zombie_ratio = 0.15  # 15% realistic zombie ratio
+        self.seed = BENCH_SEED
+
+        # Kafka-disabled measurements shared by the scaling, Kafka and CLI runs
+        self._baseline_cache: Dict[Tuple[int, float, int], Dict] = {}
 
         # Performance thresholds (FIXED: More realistic thresholds)
         self.max_processing_time_per_host = 0.01  # 10ms per host
@@ -61,79 +150,95 @@ class PerformanceBenchmarkSuite:
         )
 
     def create_realistic_host_data(
-        self, count: int, zombie_ratio: float = 0.15
+        self, count: int, zombie_ratio: float = 0.15, seed: Optional[int] = None
     ) -> List[Dict]:
         """Generate realistic host data with proper zombie distribution."""
-        hosts = []
-
-        # Define realistic zombie patterns with weights
-        zombie_patterns = [
-            # Single criteria (60% of zombies)
-            ([1, 0, 0, 0, 0], 0.25),  # CPU decrease only
-            ([0, 1, 0, 0, 0], 0.15),  # Network decrease only
-            ([0, 0, 1, 0, 0], 0.15),  # Sustained low CPU only
-            ([0, 0, 0, 1, 0], 0.05),  # Constant RAM only
-            # Double criteria (30% of zombies)
-            ([1, 1, 0, 0, 0], 0.15),  # CPU + Network (most critical)
-            ([1, 0, 1, 0, 0], 0.10),  # CPU + Sustained CPU
-            ([1, 0, 0, 1, 0], 0.05),  # CPU + RAM
-            # Triple+ criteria (10% of zombies)
-            ([1, 1, 1, 0, 0], 0.08),  # CPU + Network + Sustained
-            ([1, 1, 1, 1, 0], 0.02),  # Quad criteria
+        return list(self.iter_realistic_host_data(count, zombie_ratio, seed))
+
+    def iter_realistic_host_data(
+        self, count: int, zombie_ratio: float = 0.15, seed: Optional[int] = None
+    ) -> Iterator[Dict]:
+        """Yield the same hosts as create_realistic_host_data one at a time.
+
+        process_host_data only iterates its input, so streaming avoids keeping
+        the whole input list alive next to the enriched results.
+        """
+        if seed is None:
+            seed = self.seed
+        criteria, values = self._generate_host_columns(count, zombie_ratio, seed)
+
+        criteria_fields = [
+            "Recent_CPU_decrease",
+            "Recent_net_traffic_decrease",
+            "Sustained_Low_CPU",
+            "Excessively_constant_RAM",
+            "Daily_CPU_profile_lost",
         ]
-
-        for i in range(count):
-            # Determine if zombie based on ratio
-            is_zombie = (i / count) < zombie_ratio
-
-            if is_zombie:
-                # Select pattern based on weights
-                pattern_weights = [p[1] for p in zombie_patterns]
-                pattern_idx = random.choices(
-                    range(len(zombie_patterns)), weights=pattern_weights
-                )[0]
-                criteria = zombie_patterns[pattern_idx][0]
-            else:
-                # Non-zombie: mostly zeros, some -1 (unavailable data)
-                criteria = [0, 0, 0, 0, 0]
-                if random.random() < 0.1:  # 10% have unavailable data
-                    unavailable_idx = random.randint(0, 4)
-                    criteria[unavailable_idx] = -1
-
-            # Generate realistic metric values
-            base_values = [
-                20.5 + random.uniform(-5, 15),  # CPU decrease
-                15.3 + random.uniform(-3, 10),  # Network decrease
-                8.7 + random.uniform(-2, 5),  # Sustained CPU
-                0.15 + random.uniform(-0.05, 0.1),  # RAM variance
-                12.1 + random.uniform(-3, 8),  # Daily profile
-            ]
-
+        criterion_keys = [f"{field}_criterion" for field in criteria_fields]
+        value_keys = [f"{field}_value" for field in criteria_fields]
+
+        # Identifier columns; the ten tenant names are shared, not rebuilt
+        ids = range(count)
+        host_ids = ["BENCH-%06d" % i for i in ids]
+        hostnames = ["bench-host-%06d.example.com" % i for i in ids]
+        asset_tags = ["CI%010d" % i for i in ids]
+        tenants = [f"tenant-{t:02d}" for t in range(10)]
+
+        # process_host_data consumes dicts, so rows are materialized last
+        for i, (criteria_row, values_row) in enumerate(
+            zip(criteria.tolist(), values.tolist())
+        ):
             host = {
-                "dynatrace_host_id": f"BENCH-{i:06d}",
-                "hostname": f"bench-host-{i:06d}.example.com",
-                "tenant": f"tenant-{i % 10:02d}",
-                "asset_tag": f"CI{i:010d}",
+                "dynatrace_host_id": host_ids[i],
+                "hostname": hostnames[i],
+                "tenant": tenants[i % 10],
+                "asset_tag": asset_tags[i],
                 "pending_decommission": "False",
                 "report_date": "2025-04-23",
             }
+            host.update(zip(criterion_keys, criteria_row))
+            host.update(zip(value_keys, values_row))
+            yield host
+
+    @staticmethod
+    @functools.lru_cache(maxsize=8)
+    def _generate_host_columns(
+        count: int, zombie_ratio: float, seed: int
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """Draw the criteria and metric columns for all hosts in bulk.
+
+        Returns a ``(count, 5)`` int8 criteria matrix and a matching float
+        matrix of metric values, one column per criterion. Results are cached
+        per ``(count, zombie_ratio, seed)`` and returned read-only, since every
+        benchmark asks for the same handful of dataset sizes.
+        """
+        rng = np.random.default_rng(seed)
+
+        # The first zombie_ratio share of hosts are zombies
+        is_zombie = np.arange(count) < count * zombie_ratio
+        criteria = np.zeros((count, 5), dtype=np.int8)
+        pattern_idx = rng.choice(
+            len(_ZOMBIE_PATTERNS),
+            size=np.count_nonzero(is_zombie),
+            p=_ZOMBIE_PATTERN_WEIGHTS,
+        )
+        criteria[is_zombie] = _ZOMBIE_PATTERNS[pattern_idx]
 
-            # Add criteria with realistic values
-            criteria_fields = [
-                "Recent_CPU_decrease",
-                "Recent_net_traffic_decrease",
-                "Sustained_Low_CPU",
-                "Excessively_constant_RAM",
-                "Daily_CPU_profile_lost",
-            ]
-
-            for j, field in enumerate(criteria_fields):
-                host[f"{field}_criterion"] = criteria[j]
-                host[f"{field}_value"] = base_values[j] if criteria[j] != -1 else -1
+        # Non-zombie: mostly zeros, 10% have one unavailable (-1) criterion
+        unavailable_rows = np.flatnonzero(~is_zombie & (rng.random(count) < 0.1))
+        unavailable_idx = rng.integers(0, 5, size=unavailable_rows.size)
+        criteria[unavailable_rows, unavailable_idx] = -1
 
-            hosts.append(host)
+        # Generate realistic metric values
+        offsets = np.array([20.5, 15.3, 8.7, 0.15, 12.1])
+        lows = np.array([-5, -3, -2, -0.05, -3])
+        highs = np.array([15, 10, 5, 0.1, 8])
+        values = rng.uniform(lows, highs, size=(count, 5)) + offsets
+        values[unavailable_rows, unavailable_idx] = -1
 
-        return hosts
+        criteria.setflags(write=False)
+        values.setflags(write=False)
+        return criteria, values
 
     def get_standard_states_config(self) -> Dict[str, int]:
         """Get standard states configuration for consistent testing."""
@@ -172,6 +277,50 @@ class PerformanceBenchmarkSuite:
             "5": 1,  # All criteria
         }
 
+    def _warm_up(self) -> None:
+        """Run a small discarded batch before the first measurement.
+
+        Otherwise the first measured size pays for lazy imports and cold
+        interpreter caches, which understates its throughput.
+        """
+        process_host_data(
+            self.create_realistic_host_data(500, self.zombie_ratio),
+            self.get_standard_states_config(),
+            enable_kafka=False,
+            enable_tracking=False,
+        )
+        gc.collect()
+
+    def _measure_baseline(self, size: int) -> Dict:
+        """Time one Kafka-disabled, untracked run over ``size`` hosts.
+
+        Several benchmarks need this exact run, so it is measured once per
+        (size, zombie_ratio, seed) and only the figures are kept.
+        """
+        key = (size, self.zombie_ratio, self.seed)
+        if key not in self._baseline_cache:
+            if not self._baseline_cache:
+                self._warm_up()
+
+            hosts = self.create_realistic_host_data(size, self.zombie_ratio)
+            gc.collect()
+
+            start = time.perf_counter_ns()
+            results = process_host_data(
+                hosts,
+                self.get_standard_states_config(),
+                enable_kafka=False,
+                enable_tracking=False,
+            )
+            processing_time = (time.perf_counter_ns() - start) / 1e9
+
+            self._baseline_cache[key] = {
+                "processing_time": processing_time,
+                "host_count": len(results),
+                "zombie_count": _zombie_count(results),
+            }
+        return self._baseline_cache[key]
+
     def test_dataset_size_scaling(self) -> Dict:
         """Benchmark: Processing time vs dataset size scaling."""
         print("\n🔬 DATASET SIZE SCALING BENCHMARK")
@@ -183,31 +332,29 @@ class PerformanceBenchmarkSuite:
         zombie_counts = []
 
         states_config = self.get_standard_states_config()
-        process = psutil.Process()
 
         for size in self.dataset_sizes:
             print(f"📊 Testing {size:,} hosts...")
 
-            # Generate test data
-            hosts = self.create_realistic_host_data(size, self.zombie_ratio)
+            # Measure processing
+            baseline = self._measure_baseline(size)
 
-            # Measure baseline memory
+            # Measure peak allocations in a separate pass, since tracing
+            # slows the interpreter down and would skew the timing above
+            hosts = self.create_realistic_host_data(size, self.zombie_ratio)
             gc.collect()
-            baseline_memory = process.memory_info().rss / 1024 / 1024
-
-            # Measure processing
-            start_time = time.time()
-            results = process_host_data(
+            tracemalloc.start()
+            process_host_data(
                 hosts, states_config, enable_kafka=False, enable_tracking=False
             )
-            end_time = time.time()
+            _, peak_bytes = tracemalloc.get_traced_memory()
+            tracemalloc.stop()
 
             # Calculate metrics
-            processing_time = end_time - start_time
+            processing_time = baseline["processing_time"]
             throughput = size / processing_time
-            peak_memory = process.memory_info().rss / 1024 / 1024
-            memory_used = peak_memory - baseline_memory
-            zombie_count = sum(1 for r in results if r["is_zombie"])
+            memory_used = peak_bytes / 1024 / 1024
+            zombie_count = baseline["zombie_count"]
 
             processing_times.append(processing_time)
             throughput_rates.append(throughput)
@@ -223,17 +370,18 @@ class PerformanceBenchmarkSuite:
             assert throughput > self.min_throughput
             assert (memory_used * 1024 / size) < self.max_memory_per_host
 
-            del hosts, results
+            del hosts
             gc.collect()
 
         # Generate graph
-        self._create_scaling_benchmark_graph(
-            self.dataset_sizes,
-            processing_times,
-            throughput_rates,
-            memory_usage,
-            zombie_counts,
-        )
+        if self.render_graphs:
+            self._create_scaling_benchmark_graph(
+                self.dataset_sizes,
+                processing_times,
+                throughput_rates,
+                memory_usage,
+                zombie_counts,
+            )
 
         return {
             "dataset_sizes": self.dataset_sizes,
@@ -272,19 +420,16 @@ class PerformanceBenchmarkSuite:
             hosts = self.create_realistic_host_data(size, self.zombie_ratio)
 
             # Test with Kafka enabled
-            start_time = time.time()
+            start = time.perf_counter_ns()
             results_kafka = process_host_data(
                 hosts, states_config, enable_kafka=True, enable_tracking=False
             )
-            kafka_time = time.time() - start_time
+            kafka_time = (time.perf_counter_ns() - start) / 1e9
             kafka_times.append(kafka_time)
 
             # Test with Kafka disabled
-            start_time = time.time()
-            results_no_kafka = process_host_data(
-                hosts, states_config, enable_kafka=False, enable_tracking=False
-            )
-            no_kafka_time = time.time() - start_time
+            baseline = self._measure_baseline(size)
+            no_kafka_time = baseline["processing_time"]
             no_kafka_times.append(no_kafka_time)
 
             # Calculate overhead
@@ -297,8 +442,11 @@ class PerformanceBenchmarkSuite:
             )
             print(f"   📈 Overhead: {overhead:.1f}%")
 
-            # Verify results consistency
-            assert len(results_kafka) == len(results_no_kafka)
+            # Verify results consistency; the baseline was measured on a fresh
+            # copy of this dataset, so the Kafka arm must not have mutated it
+            assert len(results_kafka) == baseline["host_count"]
+            fresh_hosts = self.iter_realistic_host_data(size, self.zombie_ratio)
+            assert all(map(eq, hosts, fresh_hosts))
             # FIXED: More lenient assertion with informative warning
             if overhead > self.max_kafka_overhead:
                 print(
@@ -307,13 +455,14 @@ class PerformanceBenchmarkSuite:
                 print(f"   ℹ️  This may be acceptable in mocked testing environments")
                 print(f"   📝 Consider optimizing Kafka configuration for production")
 
-            del hosts, results_kafka, results_no_kafka
+            del hosts, results_kafka
             gc.collect()
 
         # Generate graph
-        self._create_kafka_impact_graph(
-            self.dataset_sizes, kafka_times, no_kafka_times, overhead_percentages
-        )
+        if self.render_graphs:
+            self._create_kafka_impact_graph(
+                self.dataset_sizes, kafka_times, no_kafka_times, overhead_percentages
+            )
 
         return {
             "dataset_sizes": self.dataset_sizes,
@@ -337,63 +486,50 @@ class PerformanceBenchmarkSuite:
         for concurrency in self.concurrency_levels:
             print(f"🔄 Testing {concurrency} concurrent requests...")
 
-            results_queue = queue.Queue()
-            error_queue = queue.Queue()
+            # Workers share one dataset; process_host_data copies each host
+            hosts = self.create_realistic_host_data(
+                hosts_per_request, self.zombie_ratio
+            )
 
             def process_request(request_id):
-                try:
-                    hosts = self.create_realistic_host_data(
-                        hosts_per_request, self.zombie_ratio
-                    )
-                    start_time = time.time()
+                start = time.perf_counter_ns()
 
-                    results = process_host_data(
-                        hosts, states_config, enable_kafka=False, enable_tracking=False
-                    )
-
-                    processing_time = time.time() - start_time
-                    zombie_count = sum(1 for r in results if r["is_zombie"])
-
-                    results_queue.put(
-                        {
-                            "request_id": request_id,
-                            "processing_time": processing_time,
-                            "zombie_count": zombie_count,
-                            "host_count": len(results),
-                            "success": True,
-                        }
-                    )
-                except Exception as e:
-                    error_queue.put({"request_id": request_id, "error": str(e)})
-
-            # Execute concurrent requests
-            threads = []
-            overall_start = time.time()
-
-            for i in range(concurrency):
-                thread = threading.Thread(target=process_request, args=(i,))
-                threads.append(thread)
-                thread.start()
+                results = process_host_data(
+                    hosts, states_config, enable_kafka=False, enable_tracking=False
+                )
 
-            # Wait for completion
-            for thread in threads:
-                thread.join()
+                processing_time = (time.perf_counter_ns() - start) / 1e9
+                zombie_count = _zombie_count(results)
 
-            overall_time = time.time() - overall_start
+                return {
+                    "request_id": request_id,
+                    "processing_time": processing_time,
+                    "zombie_count": zombie_count,
+                    "host_count": len(results),
+                    "success": True,
+                }
 
-            # Collect results
+            # Execute concurrent requests
             successful_results = []
-            while not results_queue.empty():
-                successful_results.append(results_queue.get())
-
             errors = []
-            while not error_queue.empty():
-                errors.append(error_queue.get())
+            overall_start = time.perf_counter_ns()
+
+            with ThreadPoolExecutor(max_workers=concurrency) as executor:
+                futures = {
+                    executor.submit(process_request, i): i for i in range(concurrency)
+                }
+                for future in as_completed(futures):
+                    try:
+                        successful_results.append(future.result())
+                    except Exception as e:
+                        errors.append({"request_id": futures[future], "error": str(e)})
+
+            overall_time = (time.perf_counter_ns() - overall_start) / 1e9
 
             # Calculate metrics
             if successful_results:
-                avg_response_time = statistics.mean(
-                    [r["processing_time"] for r in successful_results]
+                avg_response_time = float(
+                    np.mean([r["processing_time"] for r in successful_results])
                 )
                 total_hosts = sum(r["host_count"] for r in successful_results)
                 total_throughput = total_hosts / overall_time
@@ -418,12 +554,13 @@ class PerformanceBenchmarkSuite:
                 assert avg_response_time < 10
 
         # Generate graph
-        self._create_concurrency_graph(
-            self.concurrency_levels,
-            avg_response_times,
-            total_throughputs,
-            success_rates,
-        )
+        if self.render_graphs:
+            self._create_concurrency_graph(
+                self.concurrency_levels,
+                avg_response_times,
+                total_throughputs,
+                success_rates,
+            )
 
         return {
             "concurrency_levels": self.concurrency_levels,
@@ -443,25 +580,33 @@ class PerformanceBenchmarkSuite:
         for size in self.dataset_sizes:
             print(f"🧠 Analyzing memory for {size:,} hosts...")
 
-            # Baseline measurement
+            # Baseline RSS, kept as a coarse sanity check only
             gc.collect()
-            baseline_memory = process.memory_info().rss / 1024 / 1024
+            with process.oneshot():
+                baseline_memory = process.memory_info().rss / 1024 / 1024
+
+            # Attribute allocations with tracemalloc; RSS also counts
+            # allocator caches and shared libraries
+            tracemalloc.start()
 
             # Generate data
             hosts = self.create_realistic_host_data(size, self.zombie_ratio)
-            after_generation = process.memory_info().rss / 1024 / 1024
+            generation_bytes, _ = tracemalloc.get_traced_memory()
+            tracemalloc.reset_peak()
 
             # Process data
             states_config = self.get_standard_states_config()
             results = process_host_data(
                 hosts, states_config, enable_kafka=False, enable_tracking=False
             )
-            after_processing = process.memory_info().rss / 1024 / 1024
+            _, peak_bytes = tracemalloc.get_traced_memory()
+            top_allocators = tracemalloc.take_snapshot().statistics("lineno")[:10]
+            tracemalloc.stop()
 
             # Calculate breakdown
-            generation_memory = after_generation - baseline_memory
-            processing_memory = after_processing - after_generation
-            total_memory = after_processing - baseline_memory
+            generation_memory = generation_bytes / 1024 / 1024
+            processing_memory = (peak_bytes - generation_bytes) / 1024 / 1024
+            total_memory = peak_bytes / 1024 / 1024
             memory_per_host_kb = (total_memory * 1024) / size
 
             profile = {
@@ -471,7 +616,8 @@ class PerformanceBenchmarkSuite:
                 "processing_memory": processing_memory,
                 "total_memory": total_memory,
                 "memory_per_host_kb": memory_per_host_kb,
-                "zombie_count": sum(1 for r in results if r["is_zombie"]),
+                "zombie_count": _zombie_count(results),
+                "top_allocators": [str(stat) for stat in top_allocators],
             }
             memory_profiles.append(profile)
 
@@ -479,6 +625,8 @@ class PerformanceBenchmarkSuite:
             print(f"   ⚙️  Processing: {processing_memory:.1f}MB")
             print(f"   📈 Total: {total_memory:.1f}MB")
             print(f"   📦 Per host: {memory_per_host_kb:.2f}KB")
+            for stat in top_allocators[:3]:
+                print(f"   🔎 {stat}")
 
             # Memory efficiency assertions
             assert memory_per_host_kb < self.max_memory_per_host
@@ -488,82 +636,11 @@ class PerformanceBenchmarkSuite:
             gc.collect()
 
         # Generate graph
-        self._create_memory_analysis_graph(memory_profiles)
+        if self.render_graphs:
+            self._create_memory_analysis_graph(memory_profiles)
 
         return memory_profiles
 
-    def test_cli_vs_api_performance(self) -> Dict:
-        """Benchmark: CLI vs direct API performance comparison."""
-        print("\n🖥️  CLI vs API PERFORMANCE BENCHMARK")
-        print("=" * 50)
-
-        cli_times = []
-        api_times = []
-        file_io_overhead = []
-
-        states_config = self.get_standard_states_config()
-        test_sizes = [1000, 2500, 5000]  # Smaller sizes for CLI testing
-
-        for size in test_sizes:
-            print(f"🖥️  Testing {size:,} hosts...")
-
-            hosts = self.create_realistic_host_data(size, self.zombie_ratio)
-
-            # Test direct API
-            start_time = time.time()
-            api_results = process_host_data(
-                hosts, states_config, enable_kafka=False, enable_tracking=False
-            )
-            api_time = time.time() - start_time
-            api_times.append(api_time)
-
-            # Test CLI workflow (with file I/O)
-            with tempfile.NamedTemporaryFile(
-                mode="w", suffix=".json", delete=False
-            ) as f:
-                json.dump(hosts, f)
-                data_path = f.name
-
-            with tempfile.NamedTemporaryFile(
-                mode="w", suffix=".json", delete=False
-            ) as f:
-                json.dump(states_config, f)
-                state_path = f.name
-
-            try:
-                start_time = time.time()
-                cli_results = process_zombies(data_path, state_path)
-                cli_time = time.time() - start_time
-                cli_times.append(cli_time)
-
-                # Calculate file I/O overhead
-                overhead = ((cli_time - api_time) / api_time) * 100
-                file_io_overhead.append(overhead)
-
-                print(f"   🔗 API: {api_time:.2f}s ({size / api_time:,.0f} hosts/s)")
-                print(f"   🖥️  CLI: {cli_time:.2f}s ({size / cli_time:,.0f} hosts/s)")
-                print(f"   📁 File I/O overhead: {overhead:.1f}%")
-
-                # Verify results consistency
-                assert len(cli_results) == len(api_results)
-                assert overhead < 30  # File I/O should add < 30% overhead
-
-            finally:
-                os.unlink(data_path)
-                os.unlink(state_path)
-
-        # Generate graph
-        self._create_cli_api_comparison_graph(
-            test_sizes, cli_times, api_times, file_io_overhead
-        )
-
-        return {
-            "test_sizes": test_sizes,
-            "cli_times": cli_times,
-            "api_times": api_times,
-            "file_io_overhead": file_io_overhead,
-        }
-
     def _create_scaling_benchmark_graph(
         self,
         dataset_sizes,
@@ -573,7 +650,7 @@ class PerformanceBenchmarkSuite:
         zombie_counts,
     ):
         """Create dataset size scaling benchmark graph."""
-        fig, ((ax1, ax2), (ax3, ax4)) = plt.subplots(2, 2, figsize=(16, 12))
+        fig, ((ax1, ax2), (ax3, ax4)) = _lazy_report_axes()
 
         # 1. Processing Time vs Dataset Size (Log-Log)
         ax1.loglog(dataset_sizes, processing_times, "bo-", linewidth=3, markersize=8)
@@ -641,16 +718,9 @@ class PerformanceBenchmarkSuite:
         ax3.legend()
 
         # Add value labels on bars
-        for bar, memory in zip(bars, memory_per_host):
-            height = bar.get_height()
-            ax3.text(
-                bar.get_x() + bar.get_width() / 2.0,
-                height,
-                f"{memory:.1f}KB",
-                ha="center",
-                va="bottom",
-                fontsize=10,
-            )
+        ax3.bar_label(
+            bars, labels=[f"{memory:.1f}KB" for memory in memory_per_host], fontsize=10
+        )
 
         # 4. Zombie Detection Consistency
         zombie_rates = [
@@ -682,19 +752,16 @@ class PerformanceBenchmarkSuite:
         )
         ax4.legend()
 
-        plt.suptitle(
+        fig.suptitle(
             "Zombie Detector - Dataset Size Scaling Performance",
             fontsize=16,
             fontweight="bold",
-            y=0.95,
         )
-        plt.tight_layout()
-        plt.savefig(
+        fig.savefig(
             f"{self.output_dir}/performance_scaling_benchmark.png",
-            dpi=300,
-            bbox_inches="tight",
+            dpi=self.dpi,
+            pil_kwargs={"compress_level": 1},
         )
-        plt.close()
 
         print(
             f"📈 Scaling benchmark graph saved to: {self.output_dir}/performance_scaling_benchmark.png"
@@ -704,7 +771,7 @@ class PerformanceBenchmarkSuite:
         self, dataset_sizes, kafka_times, no_kafka_times, overhead_percentages
     ):
         """Create Kafka performance impact graph."""
-        fig, ((ax1, ax2), (ax3, ax4)) = plt.subplots(2, 2, figsize=(16, 12))
+        fig, ((ax1, ax2), (ax3, ax4)) = _lazy_report_axes()
 
         # 1. Processing Time Comparison (Bar Chart)
         x = np.arange(len(dataset_sizes))
@@ -739,16 +806,7 @@ class PerformanceBenchmarkSuite:
 
         # Add value labels
         for bars in [bars1, bars2]:
-            for bar in bars:
-                height = bar.get_height()
-                ax1.text(
-                    bar.get_x() + bar.get_width() / 2.0,
-                    height,
-                    f"{height:.1f}s",
-                    ha="center",
-                    va="bottom",
-                    fontsize=9,
-                )
+            ax1.bar_label(bars, fmt="{:.1f}s", fontsize=9)
 
         # 2. Kafka Overhead Percentage
         ax2.plot(dataset_sizes, overhead_percentages, "ro-", linewidth=3, markersize=8)
@@ -778,12 +836,9 @@ class PerformanceBenchmarkSuite:
             )
 
         # 3. Throughput Comparison
-        kafka_throughput = [
-            size / time for size, time in zip(dataset_sizes, kafka_times)
-        ]
-        no_kafka_throughput = [
-            size / time for size, time in zip(dataset_sizes, no_kafka_times)
-        ]
+        sizes = np.asarray(dataset_sizes, dtype=np.float64)
+        kafka_throughput = sizes / np.asarray(kafka_times, dtype=np.float64)
+        no_kafka_throughput = sizes / np.asarray(no_kafka_times, dtype=np.float64)
 
         ax3.plot(
             dataset_sizes,
@@ -814,23 +869,19 @@ class PerformanceBenchmarkSuite:
         table_data = [
             ["Dataset Size", "Kafka Time", "Base Time", "Overhead", "Performance"]
         ]
-        for i, size in enumerate(dataset_sizes):
-            performance = (
-                "🟢"
-                if overhead_percentages[i] < 25
-                else "🟡"
-                if overhead_percentages[i] < 50
-                else "🔴"
-            )
-            table_data.append(
-                [
-                    f"{size:,}",
-                    f"{kafka_times[i]:.2f}s",
-                    f"{no_kafka_times[i]:.2f}s",
-                    f"{overhead_percentages[i]:.1f}%",
-                    performance,
-                ]
+        performance = [
+            "🟢" if overhead < 25 else "🟡" if overhead < 50 else "🔴"
+            for overhead in overhead_percentages
+        ]
+        table_data.extend(
+            zip(
+                [f"{size:,}" for size in dataset_sizes],
+                [f"{t:.2f}s" for t in kafka_times],
+                [f"{t:.2f}s" for t in no_kafka_times],
+                [f"{overhead:.1f}%" for overhead in overhead_percentages],
+                performance,
             )
+        )
 
         table = ax4.table(
             cellText=table_data,
@@ -843,27 +894,26 @@ class PerformanceBenchmarkSuite:
         table.scale(1.2, 1.5)
 
         # Style header row
+        cells = table.get_celld()
         for i in range(len(table_data[0])):
-            table[(0, i)].set_facecolor("#2196F3")
-            table[(0, i)].set_text_props(weight="bold", color="white")
+            header = cells[(0, i)]
+            header.set_facecolor("#2196F3")
+            header.set_text_props(weight="bold", color="white")
 
         ax4.set_title(
             "Kafka Performance Impact Summary", fontsize=14, fontweight="bold"
         )
 
-        plt.suptitle(
+        fig.suptitle(
             "Zombie Detector - Kafka Performance Impact Analysis",
             fontsize=16,
             fontweight="bold",
-            y=0.95,
         )
-        plt.tight_layout()
-        plt.savefig(
+        fig.savefig(
             f"{self.output_dir}/kafka_performance_impact.png",
-            dpi=300,
-            bbox_inches="tight",
+            dpi=self.dpi,
+            pil_kwargs={"compress_level": 1},
         )
-        plt.close()
 
         print(
             f"📈 Kafka impact graph saved to: {self.output_dir}/kafka_performance_impact.png"
@@ -873,7 +923,7 @@ class PerformanceBenchmarkSuite:
         self, concurrency_levels, avg_response_times, total_throughputs, success_rates
     ):
         """Create concurrency performance graph."""
-        fig, ((ax1, ax2), (ax3, ax4)) = plt.subplots(2, 2, figsize=(16, 12))
+        fig, ((ax1, ax2), (ax3, ax4)) = _lazy_report_axes()
 
         # 1. Response Time vs Concurrency
         ax1.plot(
@@ -920,16 +970,9 @@ class PerformanceBenchmarkSuite:
         ax3.legend()
 
         # Add value labels on bars
-        for bar, rate in zip(bars, success_rates):
-            height = bar.get_height()
-            ax3.text(
-                bar.get_x() + bar.get_width() / 2.0,
-                height,
-                f"{rate:.1f}%",
-                ha="center",
-                va="bottom",
-                fontsize=10,
-            )
+        ax3.bar_label(
+            bars, labels=[f"{rate:.1f}%" for rate in success_rates], fontsize=10
+        )
 
         # 4. Concurrency Performance Summary
         ax4.axis("tight")
@@ -938,19 +981,19 @@ class PerformanceBenchmarkSuite:
         table_data = [
             ["Concurrency", "Avg Response", "Throughput", "Success Rate", "Status"]
         ]
-        for i, conc in enumerate(concurrency_levels):
-            status = (
-                "✅" if success_rates[i] >= 95 and avg_response_times[i] < 10 else "⚠️"
-            )
-            table_data.append(
-                [
-                    f"{conc}",
-                    f"{avg_response_times[i]:.2f}s",
-                    f"{total_throughputs[i]:,.0f}/s",
-                    f"{success_rates[i]:.1f}%",
-                    status,
-                ]
+        status = [
+            "✅" if rate >= 95 and response < 10 else "⚠️"
+            for rate, response in zip(success_rates, avg_response_times)
+        ]
+        table_data.extend(
+            zip(
+                [f"{conc}" for conc in concurrency_levels],
+                [f"{t:.2f}s" for t in avg_response_times],
+                [f"{rate:,.0f}/s" for rate in total_throughputs],
+                [f"{rate:.1f}%" for rate in success_rates],
+                status,
             )
+        )
 
         table = ax4.table(
             cellText=table_data,
@@ -963,25 +1006,24 @@ class PerformanceBenchmarkSuite:
         table.scale(1.2, 1.8)
 
         # Style header row
+        cells = table.get_celld()
         for i in range(len(table_data[0])):
-            table[(0, i)].set_facecolor("#FF9800")
-            table[(0, i)].set_text_props(weight="bold", color="white")
+            header = cells[(0, i)]
+            header.set_facecolor("#FF9800")
+            header.set_text_props(weight="bold", color="white")
 
         ax4.set_title("Concurrency Performance Summary", fontsize=14, fontweight="bold")
 
-        plt.suptitle(
+        fig.suptitle(
             "Zombie Detector - Concurrent Request Performance",
             fontsize=16,
             fontweight="bold",
-            y=0.95,
         )
-        plt.tight_layout()
-        plt.savefig(
+        fig.savefig(
             f"{self.output_dir}/concurrency_performance.png",
-            dpi=300,
-            bbox_inches="tight",
+            dpi=self.dpi,
+            pil_kwargs={"compress_level": 1},
         )
-        plt.close()
 
         print(
             f"📈 Concurrency graph saved to: {self.output_dir}/concurrency_performance.png"
@@ -995,7 +1037,7 @@ class PerformanceBenchmarkSuite:
         processing_memory = [p["processing_memory"] for p in memory_profiles]
         memory_per_host = [p["memory_per_host_kb"] for p in memory_profiles]
 
-        fig, ((ax1, ax2), (ax3, ax4)) = plt.subplots(2, 2, figsize=(16, 12))
+        fig, ((ax1, ax2), (ax3, ax4)) = _lazy_report_axes()
 
         # 1. Memory Usage Breakdown (Stacked Bar)
         x = np.arange(len(dataset_sizes))
@@ -1028,16 +1070,13 @@ class PerformanceBenchmarkSuite:
         ax1.grid(True, alpha=0.3, axis="y")
 
         # Add total memory labels
-        for i, total in enumerate(total_memory):
-            ax1.text(
-                i,
-                total + 5,
-                f"{total:.1f}MB",
-                ha="center",
-                va="bottom",
-                fontsize=10,
-                fontweight="bold",
-            )
+        ax1.bar_label(
+            bars2,
+            labels=[f"{total:.1f}MB" for total in total_memory],
+            padding=3,
+            fontsize=10,
+            fontweight="bold",
+        )
 
         # 2. Memory Efficiency (Per Host)
         ax2.plot(
@@ -1073,31 +1112,22 @@ class PerformanceBenchmarkSuite:
             )
 
         # 3. Memory Scaling Analysis (FIXED: Handle zero baseline)
-        scaling_factors = []
-        scaling_sizes = []
-
-        # Find first non-zero memory measurement for baseline
-        baseline_memory = None
-        baseline_size = None
-        for i, mem in enumerate(total_memory):
-            if mem > 0.01:  # At least 0.01MB (10KB) to be considered valid
-                baseline_memory = mem
-                baseline_size = dataset_sizes[i]
-                break
-
-        if baseline_memory is not None and baseline_memory > 0.01:
-            # Calculate scaling factors relative to first valid measurement
-            for i, (size, mem) in enumerate(zip(dataset_sizes, total_memory)):
-                if (
-                    size > baseline_size and mem > 0.01
-                ):  # Skip baseline and invalid measurements
-                    size_ratio = size / baseline_size
-                    memory_ratio = mem / baseline_memory
-                    scaling_factor = memory_ratio / size_ratio
-                    scaling_factors.append(scaling_factor)
-                    scaling_sizes.append(size)
-
-        if scaling_factors:  # Only plot if we have valid data
+        sizes = np.asarray(dataset_sizes, dtype=np.float64)
+        memory = np.asarray(total_memory, dtype=np.float64)
+
+        # At least 0.01MB (10KB) to be considered valid; the first valid
+        # measurement is the baseline and is not plotted itself
+        valid = memory > 0.01
+        scaling_sizes = scaling_factors = np.empty(0)
+        if valid.any():
+            base = np.argmax(valid)
+            mask = valid & (sizes > sizes[base])
+            scaling_sizes = sizes[mask]
+            scaling_factors = (memory[mask] / memory[base]) / (
+                scaling_sizes / sizes[base]
+            )
+
+        if scaling_factors.size:  # Only plot if we have valid data
             ax3.plot(
                 scaling_sizes,
                 scaling_factors,
@@ -1143,24 +1173,19 @@ class PerformanceBenchmarkSuite:
         table_data = [
             ["Size", "Generation", "Processing", "Total", "Per Host", "Efficiency"]
         ]
-        for profile in memory_profiles:
-            efficiency = (
-                "🟢"
-                if profile["memory_per_host_kb"] < 5
-                else "🟡"
-                if profile["memory_per_host_kb"] < 10
-                else "🔴"
-            )
-            table_data.append(
-                [
-                    f"{profile['size']:,}",
-                    f"{profile['generation_memory']:.1f}MB",
-                    f"{profile['processing_memory']:.1f}MB",
-                    f"{profile['total_memory']:.1f}MB",
-                    f"{profile['memory_per_host_kb']:.2f}KB",
-                    efficiency,
-                ]
+        efficiency = [
+            "🟢" if kb < 5 else "🟡" if kb < 10 else "🔴" for kb in memory_per_host
+        ]
+        table_data.extend(
+            zip(
+                [f"{size:,}" for size in dataset_sizes],
+                [f"{mb:.1f}MB" for mb in generation_memory],
+                [f"{mb:.1f}MB" for mb in processing_memory],
+                [f"{mb:.1f}MB" for mb in total_memory],
+                [f"{kb:.2f}KB" for kb in memory_per_host],
+                efficiency,
             )
+        )
 
         table = ax4.table(
             cellText=table_data,
@@ -1173,25 +1198,24 @@ class PerformanceBenchmarkSuite:
         table.scale(1.2, 1.6)
 
         # Style header row
+        cells = table.get_celld()
         for i in range(len(table_data[0])):
-            table[(0, i)].set_facecolor("#9C27B0")
-            table[(0, i)].set_text_props(weight="bold", color="white")
+            header = cells[(0, i)]
+            header.set_facecolor("#9C27B0")
+            header.set_text_props(weight="bold", color="white")
 
         ax4.set_title("Memory Analysis Summary", fontsize=14, fontweight="bold")
 
-        plt.suptitle(
+        fig.suptitle(
             "Zombie Detector - Memory Usage Analysis",
             fontsize=16,
             fontweight="bold",
-            y=0.95,
         )
-        plt.tight_layout()
-        plt.savefig(
+        fig.savefig(
             f"{self.output_dir}/memory_efficiency_analysis.png",
-            dpi=300,
-            bbox_inches="tight",
+            dpi=self.dpi,
+            pil_kwargs={"compress_level": 1},
         )
-        plt.close()
 
         print(
             f"📈 Memory analysis graph saved to: {self.output_dir}/memory_efficiency_analysis.png"
@@ -1201,7 +1225,7 @@ class PerformanceBenchmarkSuite:
         self, test_sizes, cli_times, api_times, file_io_overhead
     ):
         """Create CLI vs API performance comparison graph."""
-        fig, ((ax1, ax2), (ax3, ax4)) = plt.subplots(2, 2, figsize=(16, 12))
+        fig, ((ax1, ax2), (ax3, ax4)) = _lazy_report_axes()
 
         # 1. Processing Time Comparison
         x = np.arange(len(test_sizes))
@@ -1229,20 +1253,12 @@ class PerformanceBenchmarkSuite:
 
         # Add value labels
         for bars in [bars1, bars2]:
-            for bar in bars:
-                height = bar.get_height()
-                ax1.text(
-                    bar.get_x() + bar.get_width() / 2.0,
-                    height,
-                    f"{height:.2f}s",
-                    ha="center",
-                    va="bottom",
-                    fontsize=10,
-                )
+            ax1.bar_label(bars, fmt="{:.2f}s", fontsize=10)
 
         # 2. Throughput Comparison
-        api_throughput = [size / time for size, time in zip(test_sizes, api_times)]
-        cli_throughput = [size / time for size, time in zip(test_sizes, cli_times)]
+        sizes = np.asarray(test_sizes, dtype=np.float64)
+        api_throughput = sizes / np.asarray(api_times, dtype=np.float64)
+        cli_throughput = sizes / np.asarray(cli_times, dtype=np.float64)
 
         ax2.plot(
             test_sizes,
@@ -1281,16 +1297,11 @@ class PerformanceBenchmarkSuite:
         ax3.legend()
 
         # Add value labels on bars
-        for bar, overhead in zip(bars, file_io_overhead):
-            height = bar.get_height()
-            ax3.text(
-                bar.get_x() + bar.get_width() / 2.0,
-                height,
-                f"{overhead:.1f}%",
-                ha="center",
-                va="bottom",
-                fontsize=10,
-            )
+        ax3.bar_label(
+            bars,
+            labels=[f"{overhead:.1f}%" for overhead in file_io_overhead],
+            fontsize=10,
+        )
 
         # 4. Performance Summary
         ax4.axis("tight")
@@ -1306,17 +1317,16 @@ class PerformanceBenchmarkSuite:
                 "Overhead",
             ]
         ]
-        for i, size in enumerate(test_sizes):
-            table_data.append(
-                [
-                    f"{size:,}",
-                    f"{api_times[i]:.2f}s",
-                    f"{cli_times[i]:.2f}s",
-                    f"{api_throughput[i]:,.0f}/s",
-                    f"{cli_throughput[i]:,.0f}/s",
-                    f"{file_io_overhead[i]:.1f}%",
-                ]
+        table_data.extend(
+            zip(
+                [f"{size:,}" for size in test_sizes],
+                [f"{t:.2f}s" for t in api_times],
+                [f"{t:.2f}s" for t in cli_times],
+                [f"{rate:,.0f}/s" for rate in api_throughput],
+                [f"{rate:,.0f}/s" for rate in cli_throughput],
+                [f"{overhead:.1f}%" for overhead in file_io_overhead],
             )
+        )
 
         table = ax4.table(
             cellText=table_data,
@@ -1329,25 +1339,24 @@ class PerformanceBenchmarkSuite:
         table.scale(1.2, 1.6)
 
         # Style header row
+        cells = table.get_celld()
         for i in range(len(table_data[0])):
-            table[(0, i)].set_facecolor("#607D8B")
-            table[(0, i)].set_text_props(weight="bold", color="white")
+            header = cells[(0, i)]
+            header.set_facecolor("#607D8B")
+            header.set_text_props(weight="bold", color="white")
 
         ax4.set_title("CLI vs API Performance Summary", fontsize=14, fontweight="bold")
 
-        plt.suptitle(
+        fig.suptitle(
             "Zombie Detector - CLI vs API Performance Analysis",
             fontsize=16,
             fontweight="bold",
-            y=0.95,
         )
-        plt.tight_layout()
-        plt.savefig(
+        fig.savefig(
             f"{self.output_dir}/cli_api_performance_comparison.png",
-            dpi=300,
-            bbox_inches="tight",
+            dpi=self.dpi,
+            pil_kwargs={"compress_level": 1},
         )
-        plt.close()
 
         print(
             f"📈 CLI vs API comparison graph saved to: {self.output_dir}/cli_api_performance_comparison.png"
@@ -1370,13 +1379,14 @@ class PerformanceBenchmarkSuite:
 
             print(f"\n✅ ALL BENCHMARKS COMPLETED SUCCESSFULLY!")
             print("=" * 60)
-            print("📊 Generated performance graphs:")
-            print(f"   📈 {self.output_dir}/performance_scaling_benchmark.png")
-            print(f"   📈 {self.output_dir}/kafka_performance_impact.png")
-            print(f"   📈 {self.output_dir}/concurrency_performance.png")
-            print(f"   📈 {self.output_dir}/memory_efficiency_analysis.png")
-            print(f"   📈 {self.output_dir}/cli_api_performance_comparison.png")
-            print(f"\n🎯 All graphs are ready for documentation!")
+            if self.render_graphs:
+                print("📊 Generated performance graphs:")
+                print(f"   📈 {self.output_dir}/performance_scaling_benchmark.png")
+                print(f"   📈 {self.output_dir}/kafka_performance_impact.png")
+                print(f"   📈 {self.output_dir}/concurrency_performance.png")
+                print(f"   📈 {self.output_dir}/memory_efficiency_analysis.png")
+                print(f"   📈 {self.output_dir}/cli_api_performance_comparison.png")
+                print(f"\n🎯 All graphs are ready for documentation!")
 
             return results
 
@@ -1397,72 +1407,57 @@ class PerformanceBenchmarkSuite:
         file_io_overhead = []
 
         states_config = self.get_standard_states_config()
-        test_sizes = [1000, 2500, 5000]  # Smaller sizes for CLI testing
+        test_sizes = self.cli_test_sizes
 
-        for size in test_sizes:
-            print(f"🖥️  Testing {size:,} hosts...")
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            # The states file is identical for every size, so write it once
+            state_path = os.path.join(tmp_dir, "states.json")
+            with open(state_path, "wb") as f:
+                f.write(_json_bytes(states_config))
 
-            hosts = self.create_realistic_host_data(size, self.zombie_ratio)
+            for size in test_sizes:
+                print(f"🖥️  Testing {size:,} hosts...")
 
-            # Test direct API
-            start_time = time.time()
-            api_results = process_host_data(
-                hosts, states_config, enable_kafka=False, enable_tracking=False
-            )
-            api_time = time.time() - start_time
-            api_times.append(api_time)
+                hosts = self.create_realistic_host_data(size, self.zombie_ratio)
 
-            # Test CLI workflow (with file I/O) - FIXED: Better error handling
-            with tempfile.NamedTemporaryFile(
-                mode="w", suffix=".json", delete=False
-            ) as f:
-                json.dump(hosts, f)
-                data_path = f.name
+                # Test direct API
+                baseline = self._measure_baseline(size)
+                api_time = baseline["processing_time"]
+                api_count = baseline["host_count"]
+                api_times.append(api_time)
 
-            with tempfile.NamedTemporaryFile(
-                mode="w", suffix=".json", delete=False
-            ) as f:
-                json.dump(states_config, f)
-                state_path = f.name
+                # Test CLI workflow (with file I/O) - FIXED: Better error handling
+                data_path = os.path.join(tmp_dir, f"hosts_{size}.json")
+                with open(data_path, "wb") as f:
+                    f.write(_json_bytes(hosts))
 
-            try:
-                start_time = time.time()
+                start = time.perf_counter_ns()
 
                 # FIXED: More robust CLI testing with better error handling
                 try:
                     cli_results = process_zombies(data_path, state_path)
-                    cli_time = time.time() - start_time
+                    cli_time = (time.perf_counter_ns() - start) / 1e9
 
                     # Verify CLI actually worked and returned reasonable results
                     if cli_results is None or len(cli_results) == 0:
                         print(f"   ⚠️  CLI returned no results, using estimated time")
                         # Estimate CLI time as API time + reasonable file I/O overhead
                         cli_time = api_time * 1.2  # 20% estimated overhead
-                        cli_results = (
-                            api_results  # Use API results for consistency check
-                        )
+                        cli_count = api_count  # Use API count for consistency check
+                    else:
+                        cli_count = len(cli_results)
 
                 except Exception as e:
                     print(f"   ⚠️  CLI failed ({e}), using estimated performance")
                     # If CLI fails, estimate the time with reasonable overhead
                     cli_time = api_time * 1.15  # 15% estimated overhead
-                    cli_results = api_results  # Use API results for consistency
+                    cli_count = api_count  # Use API count for consistency
 
                 cli_times.append(cli_time)
 
                 # Calculate file I/O overhead with safety check
                 if api_time > 0.001:  # Avoid division by very small numbers
                     overhead = ((cli_time - api_time) / api_time) * 100
-                    # Cap extremely high overhead values that indicate measurement issues
-                    if overhead > 500:  # Cap at 500% for sanity
-                        print(
-                            f"   ⚠️  Detected unusually high overhead ({overhead:.0f}%), capping at 500%"
-                        )
-                        overhead = 500
-                        cli_time = (
-                            api_time * 6
-                        )  # Recalculate CLI time based on capped overhead
-                        cli_times[-1] = cli_time  # Update the stored value
                 else:
                     print(f"   ⚠️  API time too small for reliable measurement")
                     overhead = 25  # Default reasonable overhead
@@ -1474,11 +1469,9 @@ class PerformanceBenchmarkSuite:
                 print(f"   📁 File I/O overhead: {overhead:.1f}%")
 
                 # Verify results consistency with lenient check
-                if (
-                    abs(len(cli_results) - len(api_results)) > size * 0.01
-                ):  # Allow 1% difference
+                if abs(cli_count - api_count) > size * 0.01:  # Allow 1% difference
                     print(
-                        f"   ⚠️  Result count mismatch: CLI={len(cli_results)}, API={len(api_results)}"
+                        f"   ⚠️  Result count mismatch: CLI={cli_count}, API={api_count}"
                     )
 
                 # FIXED: More lenient assertion for file I/O overhead
@@ -1488,14 +1481,22 @@ class PerformanceBenchmarkSuite:
                         f"   ℹ️  This may indicate CLI initialization overhead or slow file I/O"
                     )
 
-            finally:
-                os.unlink(data_path)
-                os.unlink(state_path)
+        # Cap extremely high overhead values that indicate measurement issues,
+        # recalculating the CLI times from the capped overhead
+        overheads = np.asarray(file_io_overhead)
+        capped = overheads > 500  # Cap at 500% for sanity
+        if capped.any():
+            print(
+                f"   ⚠️  Detected unusually high overhead ({overheads.max():.0f}%), capping at 500%"
+            )
+            file_io_overhead = np.clip(overheads, None, 500).tolist()
+            cli_times = np.where(capped, np.asarray(api_times) * 6, cli_times).tolist()
 
         # Generate graph
-        self._create_cli_api_comparison_graph(
-            test_sizes, cli_times, api_times, file_io_overhead
-        )
+        if self.render_graphs:
+            self._create_cli_api_comparison_graph(
+                test_sizes, cli_times, api_times, file_io_overhead
+            )
 
         return {
             "test_sizes": test_sizes,
@@ -1504,226 +1505,24 @@ class PerformanceBenchmarkSuite:
             "file_io_overhead": file_io_overhead,
         }
 
-    def _create_memory_analysis_graph(self, memory_profiles):
-        """Create memory efficiency analysis graph."""
-        dataset_sizes = [p["size"] for p in memory_profiles]
-        total_memory = [p["total_memory"] for p in memory_profiles]
-        generation_memory = [p["generation_memory"] for p in memory_profiles]
-        processing_memory = [p["processing_memory"] for p in memory_profiles]
-        memory_per_host = [p["memory_per_host_kb"] for p in memory_profiles]
 
-        fig, ((ax1, ax2), (ax3, ax4)) = plt.subplots(2, 2, figsize=(16, 12))
+@pytest.fixture(scope="class")
+def benchmark_suite():
+    """Provide one benchmark suite instance, shared by the whole class.
 
-        # 1. Memory Usage Breakdown (Stacked Bar)
-        x = np.arange(len(dataset_sizes))
-        width = 0.6
+    Sharing it lets the scaling, Kafka and CLI benchmarks reuse the
+    suite's cached Kafka-disabled baselines instead of re-measuring them.
+    """
+    return PerformanceBenchmarkSuite()
 
-        bars1 = ax1.bar(
-            x,
-            generation_memory,
-            width,
-            label="Data Generation",
-            color="lightblue",
-            alpha=0.8,
-        )
-        bars2 = ax1.bar(
-            x,
-            processing_memory,
-            width,
-            bottom=generation_memory,
-            label="Processing",
-            color="lightcoral",
-            alpha=0.8,
-        )
-
-        ax1.set_xlabel("Dataset Size (hosts)", fontsize=12, fontweight="bold")
-        ax1.set_ylabel("Memory Usage (MB)", fontsize=12, fontweight="bold")
-        ax1.set_title("Memory Usage Breakdown", fontsize=14, fontweight="bold")
-        ax1.set_xticks(x)
-        ax1.set_xticklabels([f"{size:,}" for size in dataset_sizes], rotation=45)
-        ax1.legend()
-        ax1.grid(True, alpha=0.3, axis="y")
-
-        # Add total memory labels
-        for i, total in enumerate(total_memory):
-            ax1.text(
-                i,
-                total + 5,
-                f"{total:.1f}MB",
-                ha="center",
-                va="bottom",
-                fontsize=10,
-                fontweight="bold",
-            )
-
-        # 2. Memory Efficiency (Per Host)
-        ax2.plot(
-            dataset_sizes,
-            memory_per_host,
-            "purple",
-            marker="D",
-            linewidth=3,
-            markersize=8,
-        )
-        ax2.set_xlabel("Dataset Size (hosts)", fontsize=12, fontweight="bold")
-        ax2.set_ylabel("Memory per Host (KB)", fontsize=12, fontweight="bold")
-        ax2.set_title("Memory Efficiency per Host", fontsize=14, fontweight="bold")
-        ax2.grid(True, alpha=0.3)
-        ax2.axhline(
-            y=self.max_memory_per_host,
-            color="red",
-            linestyle="--",
-            alpha=0.7,
-            label=f"{self.max_memory_per_host}KB threshold",
-        )
-        ax2.legend()
-
-        # Add value labels
-        for size, mem in zip(dataset_sizes, memory_per_host):
-            ax2.annotate(
-                f"{mem:.2f}KB",
-                (size, mem),
-                textcoords="offset points",
-                xytext=(0, 10),
-                ha="center",
-                fontsize=10,
-            )
-
-        # 3. Memory Scaling Analysis (FIXED: Handle zero baseline)
-        scaling_factors = []
-        scaling_sizes = []
-
-        # Find first non-zero memory measurement for baseline
-        baseline_memory = None
-        baseline_size = None
-        for i, mem in enumerate(total_memory):
-            if mem > 0.01:  # At least 0.01MB (10KB) to be considered valid
-                baseline_memory = mem
-                baseline_size = dataset_sizes[i]
-                break
-
-        if baseline_memory is not None and baseline_memory > 0.01:
-            # Calculate scaling factors relative to first valid measurement
-            for i, (size, mem) in enumerate(zip(dataset_sizes, total_memory)):
-                if (
-                    size > baseline_size and mem > 0.01
-                ):  # Skip baseline and invalid measurements
-                    size_ratio = size / baseline_size
-                    memory_ratio = mem / baseline_memory
-                    scaling_factor = memory_ratio / size_ratio
-                    scaling_factors.append(scaling_factor)
-                    scaling_sizes.append(size)
-
-        if scaling_factors:  # Only plot if we have valid data
-            ax3.plot(
-                scaling_sizes,
-                scaling_factors,
-                "brown",
-                marker="^",
-                linewidth=3,
-                markersize=8,
-            )
-            ax3.set_xlabel("Dataset Size (hosts)", fontsize=12, fontweight="bold")
-            ax3.set_ylabel("Memory Scaling Factor", fontsize=12, fontweight="bold")
-            ax3.set_title(
-                "Memory Scaling Analysis\n(1.0 = Perfect Linear Scaling)",
-                fontsize=14,
-                fontweight="bold",
-            )
-            ax3.grid(True, alpha=0.3)
-            ax3.axhline(
-                y=1.0, color="green", linestyle="-", alpha=0.7, label="Linear Scaling"
-            )
-            ax3.axhline(
-                y=1.5, color="orange", linestyle="--", alpha=0.5, label="1.5x Threshold"
-            )
-            ax3.legend()
-        else:
-            # If no valid scaling data, show a message
-            ax3.text(
-                0.5,
-                0.5,
-                "Insufficient memory variation\nfor scaling analysis",
-                transform=ax3.transAxes,
-                ha="center",
-                va="center",
-                fontsize=12,
-                style="italic",
-                bbox=dict(boxstyle="round,pad=0.3", facecolor="lightgray", alpha=0.5),
-            )
-            ax3.set_title("Memory Scaling Analysis", fontsize=14, fontweight="bold")
-
-        # 4. Memory Analysis Summary
-        ax4.axis("tight")
-        ax4.axis("off")
-
-        table_data = [
-            ["Size", "Generation", "Processing", "Total", "Per Host", "Efficiency"]
-        ]
-        for profile in memory_profiles:
-            efficiency = (
-                "🟢"
-                if profile["memory_per_host_kb"] < 5
-                else "🟡"
-                if profile["memory_per_host_kb"] < 10
-                else "🔴"
-            )
-            table_data.append(
-                [
-                    f"{profile['size']:,}",
-                    f"{profile['generation_memory']:.1f}MB",
-                    f"{profile['processing_memory']:.1f}MB",
-                    f"{profile['total_memory']:.1f}MB",
-                    f"{profile['memory_per_host_kb']:.2f}KB",
-                    efficiency,
-                ]
-            )
-
-        table = ax4.table(
-            cellText=table_data,
-            cellLoc="center",
-            loc="center",
-            colWidths=[0.15, 0.18, 0.18, 0.15, 0.18, 0.15],
-        )
-        table.auto_set_font_size(False)
-        table.set_fontsize(10)
-        table.scale(1.2, 1.6)
-
-        # Style header row
-        for i in range(len(table_data[0])):
-            table[(0, i)].set_facecolor("#9C27B0")
-            table[(0, i)].set_text_props(weight="bold", color="white")
-
-        ax4.set_title("Memory Analysis Summary", fontsize=14, fontweight="bold")
-
-        plt.suptitle(
-            "Zombie Detector - Memory Usage Analysis",
-            fontsize=16,
-            fontweight="bold",
-            y=0.95,
-        )
-        plt.tight_layout()
-        plt.savefig(
-            f"{self.output_dir}/memory_efficiency_analysis.png",
-            dpi=300,
-            bbox_inches="tight",
-        )
-        plt.close()
-
-        print(
-            f"📈 Memory analysis graph saved to: {self.output_dir}/memory_efficiency_analysis.png"
-        )
 
-
-# Test class for pytest integration
+# Test class for pytest integration. Under pytest-xdist (--dist loadgroup) the
+# benchmarks stay on one worker, so they share one suite and do not compete
+# with each other for CPU while being timed.
+@pytest.mark.xdist_group("perf")
 class TestPerformanceBenchmarks:
     """Pytest integration for performance benchmarks."""
 
-    @pytest.fixture
-    def benchmark_suite(self):
-        """Provide benchmark suite instance."""
-        return PerformanceBenchmarkSuite()
-
     def test_dataset_size_scaling_benchmark(self, benchmark_suite):
         """Test dataset size scaling performance."""
         results = benchmark_suite.test_dataset_size_scaling()
@@ -1744,6 +1543,25 @@ class TestPerformanceBenchmarks:
             )
             assert throughput > 100, f"Throughput too low: {throughput:.1f} hosts/s"
 
+    @pytest.mark.parametrize("size", [1000, 2500, 5000, 10000, 25000])
+    def test_processing_benchmark(self, request, benchmark_suite, size):
+        """Record processing timings with pytest-benchmark, when installed."""
+        pytest.importorskip("pytest_benchmark")
+        benchmark = request.getfixturevalue("benchmark")
+
+        hosts = benchmark_suite.create_realistic_host_data(
+            size, benchmark_suite.zombie_ratio
+        )
+        results = benchmark(
+            process_host_data,
+            hosts,
+            benchmark_suite.get_standard_states_config(),
+            enable_kafka=False,
+            enable_tracking=False,
+        )
+
+        assert len(results) == size
+
     def test_kafka_performance_impact_benchmark(self, benchmark_suite):
         """Test Kafka performance impact."""
         results = benchmark_suite.test_kafka_performance_impact()
@@ -1754,10 +1572,14 @@ class TestPerformanceBenchmarks:
         assert "no_kafka_times" in results
         assert "overhead_percentages" in results
 
-        for overhead in results["overhead_percentages"]:
-            if overhead > 300:
-                print(f"⚠️  Very high Kafka overhead: {overhead:.1f}%")
-                print("   This may be expected in mocked testing environments")
+        overheads = np.asarray(results["overhead_percentages"])
+        high = overheads > 300
+        if high.any():
+            print(
+                f"⚠️  Very high Kafka overhead in {int(high.sum())} run(s), "
+                f"peak {overheads[np.argmax(overheads)]:.1f}%"
+            )
+            print("   This may be expected in mocked testing environments")
 
     def test_concurrency_performance_benchmark(self, benchmark_suite):
         """Test concurrency performance."""
@@ -1793,12 +1615,10 @@ class TestPerformanceBenchmarks:
             assert "total_memory" in profile
 
             # Verify memory efficiency
-            assert profile["memory_per_host_kb"] < 15, (
-                f"Memory per host too high: {profile['memory_per_host_kb']:.2f}KB"
-            )
-            assert profile["total_memory"] < 1000, (
-                f"Total memory too high: {profile['total_memory']:.1f}MB"
-            )
+            per_host_kb = profile["memory_per_host_kb"]
+            total_memory = profile["total_memory"]
+            assert per_host_kb < 15, f"Memory per host too high: {per_host_kb:.2f}KB"
+            assert total_memory < 1000, f"Total memory too high: {total_memory:.1f}MB"
 
     def test_cli_api_performance_benchmark(self, benchmark_suite):
         """Test CLI vs API performance."""
@@ -1811,33 +1631,18 @@ class TestPerformanceBenchmarks:
         assert "file_io_overhead" in results
 
         # FIXED: More lenient file I/O overhead verification
-        for overhead in results["file_io_overhead"]:
-            if overhead > 200:  # Only warn for extremely high overhead
-                print(f"⚠️  Very high file I/O overhead: {overhead:.1f}%")
-                print(
-                    "   This may indicate CLI initialization overhead or system performance issues"
-                )
-                print("   Consider testing on a faster system or with larger datasets")
-            # Don't fail the test for high overhead as this can be environment-dependent
-
-    def test_memory_efficiency_benchmark(self, benchmark_suite):
-        """Test memory efficiency."""
-        results = benchmark_suite.test_memory_efficiency_analysis()
-
-        # Verify results structure
-        assert len(results) > 0
-        for profile in results:
-            assert "size" in profile
-            assert "memory_per_host_kb" in profile
-            assert "total_memory" in profile
-
-            # Verify memory efficiency
-            assert profile["memory_per_host_kb"] < 15, (
-                f"Memory per host too high: {profile['memory_per_host_kb']:.2f}KB"
+        overheads = np.asarray(results["file_io_overhead"])
+        high = overheads > 200  # Only warn for extremely high overhead
+        if high.any():
+            print(
+                f"⚠️  Very high file I/O overhead in {int(high.sum())} run(s), "
+                f"peak {overheads[np.argmax(overheads)]:.1f}%"
             )
-            assert profile["total_memory"] < 1000, (
-                f"Total memory too high: {profile['total_memory']:.1f}MB"
+            print(
+                "   This may indicate CLI initialization overhead or system performance issues"
             )
+            print("   Consider testing on a faster system or with larger datasets")
+        # Don't fail the test for high overhead as this can be environment-dependent
 
 
 # Direct execution for manual testing and graph generation
@@ -1858,29 +1663,22 @@ if __name__ == "__main__":
         print("=" * 60)
 
         scaling_results = results["scaling"]
-        max_throughput = max(scaling_results["throughput_rates"])
-        min_memory_per_host = min(
-            [
-                (mem * 1024) / size
-                for mem, size in zip(
-                    scaling_results["memory_usage"], scaling_results["dataset_sizes"]
-                )
-            ]
+        max_throughput = float(np.max(scaling_results["throughput_rates"]))
+        min_memory_per_host = float(
+            np.min(
+                np.asarray(scaling_results["memory_usage"])
+                * 1024
+                / np.asarray(scaling_results["dataset_sizes"])
+            )
         )
 
         kafka_results = results["kafka"]
-        avg_kafka_overhead = statistics.mean(kafka_results["overhead_percentages"])
+        avg_kafka_overhead = float(np.mean(kafka_results["overhead_percentages"]))
 
         concurrency_results = results["concurrency"]
-        max_concurrency = max(
-            [
-                conc
-                for conc, rate in zip(
-                    concurrency_results["concurrency_levels"],
-                    concurrency_results["success_rates"],
-                )
-                if rate >= 95
-            ]
+        stable = np.asarray(concurrency_results["success_rates"]) >= 95
+        max_concurrency = int(
+            np.asarray(concurrency_results["concurrency_levels"])[stable].max()
         )
 
         print(f"🔥 Peak throughput: {max_throughput:,.0f} hosts/second")
@@ -1888,8 +1686,9 @@ if __name__ == "__main__":
         print(f"⚡ Avg Kafka overhead: {avg_kafka_overhead:.1f}%")
         print(f"🔄 Max stable concurrency: {max_concurrency} requests")
 
-        print(f"\n🎯 All performance graphs generated successfully!")
-        print(f"📁 Location: zombie-detector/docs/_static/")
+        if suite.render_graphs:
+            print(f"\n🎯 All performance graphs generated successfully!")
+            print(f"📁 Location: zombie-detector/docs/_static/")
 
         sys.exit(0)
 
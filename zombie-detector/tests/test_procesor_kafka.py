@@ -4,82 +4,129 @@ import pytest
 import tempfile
 import os
 import json
-from unittest.mock import Mock, patch, MagicMock
+from types import MappingProxyType
+from unittest.mock import DEFAULT, Mock, patch, MagicMock
 from zombie_detector.core.processor import process_host_data, _load_kafka_config
+from zombie_detector.core.zombie_publisher import ZombieKafkaPublisher
+from zombie_detector.core.zombie_tracker import ZombieTracker
+
+# Use the real criterion codes from your system
+_FULL_STATE_MAP = MappingProxyType(
+    {
+        "0": 0,
+        "1A": 1,
+        "1B": 1,
+        "1C": 1,
+        "1D": 1,
+        "1E": 1,
+        "2A": 1,
+        "2B": 1,
+        "2C": 1,
+        "2D": 1,
+        "2E": 1,
+        "2F": 1,
+        "2G": 1,
+        "2H": 1,
+        "2I": 1,
+        "2J": 1,
+        "3A": 1,
+        "3B": 1,
+        "3C": 1,
+        "3D": 1,
+        "3E": 1,
+        "3F": 1,
+        "3G": 1,
+        "3H": 1,
+        "3I": 1,
+        "3J": 1,
+        "4A": 1,
+        "4B": 1,
+        "4C": 1,
+        "4D": 1,
+        "4E": 1,
+        "5": 1,
+    }
+)
+
+# Single and double criteria enabled, no-zombie code disabled
+_PAIR_STATE_MAP = MappingProxyType(
+    {
+        "0": 0,  # No zombie - disabled (important!)
+        "1A": 1,
+        "1B": 1,
+        "1C": 1,
+        "1D": 1,
+        "1E": 1,
+        "2A": 1,
+        "2B": 1,
+        "2C": 1,
+        "2D": 1,
+        "2E": 1,
+        "2F": 1,
+        "2G": 1,
+        "2H": 1,
+        "2I": 1,
+        "2J": 1,
+    }
+)
+
+
+@pytest.fixture(scope="module")
+def sample_data():
+    """Provide the sample hosts and state map, built once per module."""
+    sample_hosts = [
+        {
+            "dynatrace_host_id": "HOST-1",
+            "hostname": "hostname1",
+            "Recent_CPU_decrease_criterion": 1,
+            "Recent_net_traffic_decrease_criterion": -1,  # Inactive
+            "Sustained_Low_CPU_criterion": 1,
+            "Excessively_constant_RAM_criterion": 0,
+            "Daily_CPU_profile_lost_criterion": -1,
+            "tenant": "tenant1",
+            "asset_tag": "CI01234567",
+        },
+        {
+            "dynatrace_host_id": "HOST-2",
+            "hostname": "hostname2",
+            "Recent_CPU_decrease_criterion": 1,
+            "Recent_net_traffic_decrease_criterion": 1,
+            "Sustained_Low_CPU_criterion": 0,
+            "Excessively_constant_RAM_criterion": -1,  # Inactive
+            "Daily_CPU_profile_lost_criterion": -1,
+            "tenant": "tenant2",
+            "asset_tag": "CI02345678",
+        },
+    ]
+
+    return {"hosts": sample_hosts, "state_map": _FULL_STATE_MAP}
+
+
+@pytest.fixture(scope="class")
+def _processor_patches():
+    """Patch the processor's Kafka and tracking collaborators once per class."""
+    with patch.multiple(
+        "zombie_detector.core.processor",
+        ZombieKafkaPublisher=DEFAULT,
+        _load_kafka_config=DEFAULT,
+        ZombieTracker=DEFAULT,
+    ) as mocks:
+        yield mocks
 
 
 class TestProcessorKafkaIntegration:
-    def setUp(self):
-        """Set up test data."""
-        self.sample_hosts = [
-            {
-                "dynatrace_host_id": "HOST-1",
-                "hostname": "hostname1",
-                "Recent_CPU_decrease_criterion": 1,
-                "Recent_net_traffic_decrease_criterion": -1,  # Inactive
-                "Sustained_Low_CPU_criterion": 1,
-                "Excessively_constant_RAM_criterion": 0,
-                "Daily_CPU_profile_lost_criterion": -1,
-                "tenant": "tenant1",
-                "asset_tag": "CI01234567",
-            },
-            {
-                "dynatrace_host_id": "HOST-2",
-                "hostname": "hostname2",
-                "Recent_CPU_decrease_criterion": 1,
-                "Recent_net_traffic_decrease_criterion": 1,
-                "Sustained_Low_CPU_criterion": 0,
-                "Excessively_constant_RAM_criterion": -1,  # Inactive
-                "Daily_CPU_profile_lost_criterion": -1,
-                "tenant": "tenant2",
-                "asset_tag": "CI02345678",
-            },
-        ]
-
-        # Use the real criterion codes from your system
-        self.state_map = {
-            "0": 0,
-            "1A": 1,
-            "1B": 1,
-            "1C": 1,
-            "1D": 1,
-            "1E": 1,
-            "2A": 1,
-            "2B": 1,
-            "2C": 1,
-            "2D": 1,
-            "2E": 1,
-            "2F": 1,
-            "2G": 1,
-            "2H": 1,
-            "2I": 1,
-            "2J": 1,
-            "3A": 1,
-            "3B": 1,
-            "3C": 1,
-            "3D": 1,
-            "3E": 1,
-            "3F": 1,
-            "3G": 1,
-            "3H": 1,
-            "3I": 1,
-            "3J": 1,
-            "4A": 1,
-            "4B": 1,
-            "4C": 1,
-            "4D": 1,
-            "4E": 1,
-            "5": 1,
-        }
-
-    @patch("zombie_detector.core.processor.ZombieKafkaPublisher")
-    @patch("zombie_detector.core.processor._load_kafka_config")
-    @patch("zombie_detector.core.processor.ZombieTracker")
-    def test_process_host_data_with_kafka_enabled(
-        self, mock_tracker, mock_kafka_config, mock_publisher
-    ):
+    @pytest.fixture
+    def processor_mocks(self, _processor_patches):
+        """Provide the class-wide mocks with calls and configuration cleared."""
+        for mock in _processor_patches.values():
+            mock.reset_mock(return_value=True, side_effect=True)
+        return _processor_patches
+
+    def test_process_host_data_with_kafka_enabled(self, processor_mocks, sample_data):
         """Test processing hosts with Kafka publishing enabled."""
-        self.setUp()
+        mock_tracker = processor_mocks["ZombieTracker"]
+        mock_kafka_config = processor_mocks["_load_kafka_config"]
+        mock_publisher = processor_mocks["ZombieKafkaPublisher"]
 
         # Mock Kafka config
         mock_kafka_config.return_value = {
@@ -89,7 +136,7 @@ class TestProcessorKafkaIntegration:
         }
 
         # Mock tracker
-        mock_tracker_instance = Mock()
+        mock_tracker_instance = Mock(spec=ZombieTracker)
         mock_tracker.return_value = mock_tracker_instance
         mock_tracker_instance.save_current_zombies.return_value = {
             "new_zombies": ["HOST-1"],
@@ -99,11 +146,14 @@ class TestProcessorKafkaIntegration:
         }
 
         # Mock publisher
-        mock_publisher_instance = Mock()
+        mock_publisher_instance = Mock(spec=ZombieKafkaPublisher)
         mock_publisher.return_value = mock_publisher_instance
 
         results = process_host_data(
-            self.sample_hosts, self.state_map, enable_tracking=True, enable_kafka=True
+            sample_data["hosts"],
+            sample_data["state_map"],
+            enable_tracking=True,
+            enable_kafka=True,
         )
 
         # Verify results
@@ -128,23 +178,22 @@ class TestProcessorKafkaIntegration:
         )
         mock_publisher_instance.publish_zombie_detection.assert_called_once()
         mock_publisher_instance.publish_tracking_stats.assert_called_once()
-        mock_publisher_instance.publish_zombie_lifecycle_event.assert_called()
+        mock_publisher_instance.publish_zombie_lifecycle_event.assert_called_once_with(
+            "zombie_new", results[0]
+        )
         mock_publisher_instance.close.assert_called_once()
 
-    @patch("zombie_detector.core.processor.ZombieKafkaPublisher")
-    @patch("zombie_detector.core.processor._load_kafka_config")
-    def test_process_host_data_with_kafka_disabled(
-        self, mock_kafka_config, mock_publisher
-    ):
+    def test_process_host_data_with_kafka_disabled(self, processor_mocks, sample_data):
         """Test processing hosts with Kafka disabled."""
-        self.setUp()
+        mock_kafka_config = processor_mocks["_load_kafka_config"]
+        mock_publisher = processor_mocks["ZombieKafkaPublisher"]
 
         # Mock Kafka config - disabled
         mock_kafka_config.return_value = {"enabled": False}
 
         results = process_host_data(
-            self.sample_hosts,
-            self.state_map,
+            sample_data["hosts"],
+            sample_data["state_map"],
             enable_tracking=False,
             enable_kafka=True,  # Enabled but config says disabled
         )
@@ -155,14 +204,15 @@ class TestProcessorKafkaIntegration:
         # Verify Kafka publisher was not called
         mock_publisher.assert_not_called()
 
-    @patch("zombie_detector.core.processor._load_kafka_config")
-    def test_process_host_data_with_kafka_parameter_disabled(self, mock_kafka_config):
+    def test_process_host_data_with_kafka_parameter_disabled(
+        self, processor_mocks, sample_data
+    ):
         """Test processing hosts with Kafka parameter disabled."""
-        self.setUp()
+        mock_kafka_config = processor_mocks["_load_kafka_config"]
 
         results = process_host_data(
-            self.sample_hosts,
-            self.state_map,
+            sample_data["hosts"],
+            sample_data["state_map"],
             enable_tracking=False,
             enable_kafka=False,  # Explicitly disabled
         )
@@ -173,14 +223,12 @@ class TestProcessorKafkaIntegration:
         # Verify config wasn't even loaded
         mock_kafka_config.assert_not_called()
 
-    @patch("zombie_detector.core.processor.ZombieKafkaPublisher")
-    @patch("zombie_detector.core.processor._load_kafka_config")
-    @patch("zombie_detector.core.processor.ZombieTracker")
     def test_process_host_data_kafka_exception_handling(
-        self, mock_tracker, mock_kafka_config, mock_publisher
+        self, processor_mocks, sample_data
     ):
         """Test Kafka exception handling doesn't break processing."""
-        self.setUp()
+        mock_kafka_config = processor_mocks["_load_kafka_config"]
+        mock_publisher = processor_mocks["ZombieKafkaPublisher"]
 
         # Mock Kafka config
         mock_kafka_config.return_value = {
@@ -194,20 +242,20 @@ class TestProcessorKafkaIntegration:
 
         # Should not raise exception
         results = process_host_data(
-            self.sample_hosts, self.state_map, enable_tracking=False, enable_kafka=True
+            sample_data["hosts"],
+            sample_data["state_map"],
+            enable_tracking=False,
+            enable_kafka=True,
         )
 
         # Verify processing continued despite Kafka error
         assert len(results) == 2
         assert results[0]["is_zombie"] == True
 
-    @patch("zombie_detector.core.processor.ZombieKafkaPublisher")
-    @patch("zombie_detector.core.processor._load_kafka_config")
-    @patch("zombie_detector.core.processor.ZombieTracker")
-    def test_process_host_data_no_zombies_no_kafka_calls(
-        self, mock_tracker, mock_kafka_config, mock_publisher
-    ):
+    def test_process_host_data_no_zombies_no_kafka_calls(self, processor_mocks):
         """Test that Kafka lifecycle events aren't published when no zombies."""
+        mock_kafka_config = processor_mocks["_load_kafka_config"]
+        mock_publisher = processor_mocks["ZombieKafkaPublisher"]
         # Create non-zombie hosts (all criteria = 0)
         non_zombie_hosts = [
             {
@@ -221,26 +269,6 @@ class TestProcessorKafkaIntegration:
             }
         ]
 
-        # State map with all zombie types enabled
-        state_map = {
-            "0": 0,  # No zombie - disabled (important!)
-            "1A": 1,
-            "1B": 1,
-            "1C": 1,
-            "1D": 1,
-            "1E": 1,
-            "2A": 1,
-            "2B": 1,
-            "2C": 1,
-            "2D": 1,
-            "2E": 1,
-            "2F": 1,
-            "2G": 1,
-            "2H": 1,
-            "2I": 1,
-            "2J": 1,
-        }
-
         # Mock Kafka config
         mock_kafka_config.return_value = {
             "enabled": True,
@@ -249,11 +277,11 @@ class TestProcessorKafkaIntegration:
         }
 
         # Mock publisher
-        mock_publisher_instance = Mock()
+        mock_publisher_instance = Mock(spec=ZombieKafkaPublisher)
         mock_publisher.return_value = mock_publisher_instance
 
         results = process_host_data(
-            non_zombie_hosts, state_map, enable_tracking=True, enable_kafka=True
+            non_zombie_hosts, _PAIR_STATE_MAP, enable_tracking=True, enable_kafka=True
         )
 
         # Verify no zombies
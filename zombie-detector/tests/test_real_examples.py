@@ -1,97 +1,138 @@
 import pytest
-import json
-import tempfile
-import os
-from unittest.mock import Mock, patch
-from zombie_detector import process_zombies
+from types import MappingProxyType
+from unittest.mock import patch
+from zombie_detector import VALID_CRITERION_TYPES, process_zombies
 from zombie_detector.core.processor import process_host_data
 
+from _fakes import FakePublisher
+
+# Read-only inputs shared by every test in the module
+_EXAMPLE_HOSTS = tuple(
+    MappingProxyType(host)
+    for host in [
+        {
+            "report_date": "2025-04-23",
+            "dynatrace_host_id": "HOST-1",
+            "hostname": "hostname1",
+            "tenant": "tenant-owner1",
+            "asset_tag": "CI01234567",
+            "pending_decommission": "False",
+            "Recent_CPU_decrease_criterion": 1,
+            "Recent_CPU_decrease_value": "35.47357250072376",
+            "Recent_net_traffic_decrease_criterion": -1,
+            "Recent_net_traffic_decrease_value": -1,
+            "Sustained_Low_CPU_criterion": 1,
+            "Sustained_Low_CPU_value": "6.92528686523",
+            "Excessively_constant_RAM_criterion": 0,
+            "Excessively_constant_RAM_value": "0.19013799230427317",
+            "Daily_CPU_profile_lost_criterion": -1,
+            "Daily_CPU_profile_lost_value": -1,
+        },
+        {
+            "report_date": "2025-04-23",
+            "dynatrace_host_id": "HOST-3",
+            "hostname": "hostname3",
+            "tenant": "tenant-owner3",
+            "asset_tag": "CI03456789",
+            "pending_decommission": "False",
+            "Recent_CPU_decrease_criterion": 1,
+            "Recent_CPU_decrease_value": "8.735907894878215",
+            "Recent_net_traffic_decrease_criterion": 1,
+            "Recent_net_traffic_decrease_value": "3.645033143530929",
+            "Sustained_Low_CPU_criterion": 0,
+            "Sustained_Low_CPU_value": "92.7633866628",
+            "Excessively_constant_RAM_criterion": -1,
+            "Excessively_constant_RAM_value": -1,
+            "Daily_CPU_profile_lost_criterion": -1,
+            "Daily_CPU_profile_lost_value": -1,
+        },
+    ]
+)
+
+_STATES_CONFIG = MappingProxyType(
+    {
+        "0": 0,
+        "1A": 1,
+        "1B": 1,
+        "1C": 1,
+        "1D": 1,
+        "1E": 1,
+        "2A": 1,
+        "2B": 1,
+        "2C": 1,
+        "2D": 1,
+        "2E": 1,
+        "2F": 1,
+        "2G": 1,
+        "2H": 1,
+        "2I": 1,
+        "2J": 1,
+        "3A": 1,
+        "3B": 1,
+        "3C": 1,
+        "3D": 1,
+        "3E": 1,
+        "3F": 1,
+        "3G": 1,
+        "3H": 1,
+        "3I": 1,
+        "3J": 1,
+        "4A": 1,
+        "4B": 1,
+        "4C": 1,
+        "4D": 1,
+        "4E": 1,
+        "5": 1,
+    }
+)
+
+
+# Publisher arguments built from the test Kafka config and default security
+_EXPECTED_KAFKA_CALL = MappingProxyType(
+    {
+        "bootstrap_servers": "localhost:9092",
+        "topic_prefix": "zombie-detector",
+        "security_protocol": "PLAINTEXT",
+        "ssl_config": None,
+        "sasl_config": None,
+    }
+)
+
+
+def _by_id(results):
+    """Index results by host id so each lookup is a dict access."""
+    return {r["dynatrace_host_id"]: r for r in results}
+
 
 class TestKafkaIntegration:
-    @pytest.fixture
+    @pytest.fixture(scope="module")
     def example_data(self):
         """Load example data matching your actual JSON."""
-        return [
-            {
-                "report_date": "2025-04-23",
-                "dynatrace_host_id": "HOST-1",
-                "hostname": "hostname1",
-                "tenant": "tenant-owner1",
-                "asset_tag": "CI01234567",
-                "pending_decommission": "False",
-                "Recent_CPU_decrease_criterion": 1,
-                "Recent_CPU_decrease_value": "35.47357250072376",
-                "Recent_net_traffic_decrease_criterion": -1,
-                "Recent_net_traffic_decrease_value": -1,
-                "Sustained_Low_CPU_criterion": 1,
-                "Sustained_Low_CPU_value": "6.92528686523",
-                "Excessively_constant_RAM_criterion": 0,
-                "Excessively_constant_RAM_value": "0.19013799230427317",
-                "Daily_CPU_profile_lost_criterion": -1,
-                "Daily_CPU_profile_lost_value": -1,
-            },
-            {
-                "report_date": "2025-04-23",
-                "dynatrace_host_id": "HOST-3",
-                "hostname": "hostname3",
-                "tenant": "tenant-owner3",
-                "asset_tag": "CI03456789",
-                "pending_decommission": "False",
-                "Recent_CPU_decrease_criterion": 1,
-                "Recent_CPU_decrease_value": "8.735907894878215",
-                "Recent_net_traffic_decrease_criterion": 1,
-                "Recent_net_traffic_decrease_value": "3.645033143530929",
-                "Sustained_Low_CPU_criterion": 0,
-                "Sustained_Low_CPU_value": "92.7633866628",
-                "Excessively_constant_RAM_criterion": -1,
-                "Excessively_constant_RAM_value": -1,
-                "Daily_CPU_profile_lost_criterion": -1,
-                "Daily_CPU_profile_lost_value": -1,
-            },
-        ]
+        return _EXAMPLE_HOSTS
 
-    @pytest.fixture
+    @pytest.fixture(scope="module")
     def states_config(self):
         """States configuration with real codes."""
-        return {
-            "0": 0,
-            "1A": 1,
-            "1B": 1,
-            "1C": 1,
-            "1D": 1,
-            "1E": 1,
-            "2A": 1,
-            "2B": 1,
-            "2C": 1,
-            "2D": 1,
-            "2E": 1,
-            "2F": 1,
-            "2G": 1,
-            "2H": 1,
-            "2I": 1,
-            "2J": 1,
-            "3A": 1,
-            "3B": 1,
-            "3C": 1,
-            "3D": 1,
-            "3E": 1,
-            "3F": 1,
-            "3G": 1,
-            "3H": 1,
-            "3I": 1,
-            "3J": 1,
-            "4A": 1,
-            "4B": 1,
-            "4C": 1,
-            "4D": 1,
-            "4E": 1,
-            "5": 1,
-        }
+        return _STATES_CONFIG
+
+    @pytest.fixture
+    def publishers(self, monkeypatch):
+        """Swap the processor's publisher for FakePublisher; list those built."""
+        built = []
+
+        def build(**kwargs):
+            publisher = FakePublisher(**kwargs)
+            built.append(publisher)
+            return publisher
+
+        monkeypatch.setattr(
+            "zombie_detector.core.processor.ZombieKafkaPublisher", build
+        )
+        return built
 
-    @patch("zombie_detector.core.processor.ZombieKafkaPublisher")
     @patch("zombie_detector.core.processor._load_kafka_config")
     def test_full_integration_with_example_data(
-        self, mock_kafka_config, mock_publisher, example_data, states_config
+        self, mock_kafka_config, publishers, example_data, states_config
     ):
         """Test full integration using your example data."""
         mock_kafka_config.return_value = {
@@ -100,43 +141,34 @@ class TestKafkaIntegration:
             "topic_prefix": "zombie-detector",
         }
 
-        mock_publisher_instance = Mock()
-        mock_publisher.return_value = mock_publisher_instance
-
         results = process_host_data(example_data, states_config, enable_kafka=True)
 
         assert len(results) == 2
 
         # FIXED: Use actual codes returned by the system
         # HOST-1: CPU + Sustained CPU = 2B (actual code, not 2C)
-        host1 = next(r for r in results if r["dynatrace_host_id"] == "HOST-1")
+        by_id = _by_id(results)
+        host1 = by_id["HOST-1"]
         assert host1["criterion_type"] == "2B"  # FIXED: Use actual code
         assert host1["is_zombie"] == True
 
         # HOST-3: CPU + Network = 2A (indices 0,1)
-        host3 = next(r for r in results if r["dynatrace_host_id"] == "HOST-3")
+        host3 = by_id["HOST-3"]
         assert host3["criterion_type"] == "2A"  # This should be correct
         assert host3["is_zombie"] == True
 
         # FIXED: Verify Kafka calls with the expected authentication parameters
-        mock_publisher.assert_called_once_with(
-            bootstrap_servers="localhost:9092",
-            topic_prefix="zombie-detector",
-            security_protocol="PLAINTEXT",  # Added: Expected default security protocol
-            ssl_config=None,  # Added: Expected default SSL config
-            sasl_config=None,  # Added: Expected default SASL config
-        )
+        (publisher,) = publishers
+        assert publisher.kwargs == _EXPECTED_KAFKA_CALL
 
-        mock_publisher_instance.publish_zombie_detection.assert_called_once()
-        call_args = mock_publisher_instance.publish_zombie_detection.call_args[0][0]
-        assert len(call_args) == 2
+        (published_results,) = publisher.detections
+        assert len(published_results) == 2
 
-        mock_publisher_instance.close.assert_called_once()
+        assert publisher.closed
 
-    @patch("zombie_detector.core.processor.ZombieKafkaPublisher")
     @patch("zombie_detector.core.processor._load_kafka_config")
     def test_kafka_message_content_validation(
-        self, mock_kafka_config, mock_publisher, example_data, states_config
+        self, mock_kafka_config, publishers, example_data, states_config
     ):
         """Test that Kafka messages contain expected content."""
         mock_kafka_config.return_value = {
@@ -145,14 +177,9 @@ class TestKafkaIntegration:
             "topic_prefix": "zombie-detector",
         }
 
-        mock_publisher_instance = Mock()
-        mock_publisher.return_value = mock_publisher_instance
-
         results = process_host_data(example_data, states_config, enable_kafka=True)
 
-        detection_call = mock_publisher_instance.publish_zombie_detection.call_args[0][
-            0
-        ]
+        (detection_call,) = publishers[0].detections
 
         for host_result in detection_call:
             assert "dynatrace_host_id" in host_result
@@ -164,45 +191,11 @@ class TestKafkaIntegration:
 
             if host_result["is_zombie"]:
                 # FIXED: Check for actual codes returned by the system
-                assert host_result["criterion_type"] in [
-                    "1A",
-                    "1B",
-                    "1C",
-                    "1D",
-                    "1E",
-                    "2A",
-                    "2B",
-                    "2C",
-                    "2D",
-                    "2E",
-                    "2F",
-                    "2G",
-                    "2H",
-                    "2I",
-                    "2J",
-                    "3A",
-                    "3B",
-                    "3C",
-                    "3D",
-                    "3E",
-                    "3F",
-                    "3G",
-                    "3H",
-                    "3I",
-                    "3J",
-                    "4A",
-                    "4B",
-                    "4C",
-                    "4D",
-                    "4E",
-                    "5",
-                ]
+                assert host_result["criterion_type"] in VALID_CRITERION_TYPES
+                assert host_result["criterion_type"] != "0"
 
-    @patch("zombie_detector.core.processor.ZombieKafkaPublisher")
     @patch("zombie_detector.core.processor._load_kafka_config")
-    def test_process_zombies_function_with_kafka(
-        self, mock_kafka_config, mock_publisher
-    ):
+    def test_process_zombies_function_with_kafka(self, mock_kafka_config, publishers):
         """Test the main process_zombies function with Kafka enabled."""
         mock_kafka_config.return_value = {
             "enabled": True,
@@ -210,10 +203,7 @@ class TestKafkaIntegration:
             "topic_prefix": "zombie-detector",
         }
 
-        mock_publisher_instance = Mock()
-        mock_publisher.return_value = mock_publisher_instance
-
-        # Create temporary test files
+        # Test inputs, passed in already parsed
         example_data = [
             {
                 "dynatrace_host_id": "HOST-TEST",
@@ -228,39 +218,19 @@ class TestKafkaIntegration:
 
         states_config = {"1A": 1, "0": 0}
 
-        with tempfile.NamedTemporaryFile(mode="w", suffix=".json", delete=False) as f:
-            json.dump(example_data, f)
-            data_path = f.name
-
-        with tempfile.NamedTemporaryFile(mode="w", suffix=".json", delete=False) as f:
-            json.dump(states_config, f)
-            state_path = f.name
+        results = process_zombies(hosts=example_data, state_map=states_config)
 
-        try:
-            # FIXED: Remove enable_kafka parameter as it's not supported by process_zombies
-            results = process_zombies(data_path, state_path)
-
-            assert len(results) == 1
-            assert results[0]["criterion_type"] == "1A"
-            assert results[0]["is_zombie"] == True
-
-            # FIXED: Verify Kafka publisher was called with authentication parameters
-            mock_publisher.assert_called_once_with(
-                bootstrap_servers="localhost:9092",
-                topic_prefix="zombie-detector",
-                security_protocol="PLAINTEXT",
-                ssl_config=None,
-                sasl_config=None,
-            )
+        assert len(results) == 1
+        assert results[0]["criterion_type"] == "1A"
+        assert results[0]["is_zombie"] == True
 
-        finally:
-            os.unlink(data_path)
-            os.unlink(state_path)
+        # FIXED: Verify Kafka publisher was called with authentication parameters
+        (publisher,) = publishers
+        assert publisher.kwargs == _EXPECTED_KAFKA_CALL
 
-    @patch("zombie_detector.core.processor.ZombieKafkaPublisher")
     @patch("zombie_detector.core.processor._load_kafka_config")
     def test_process_zombies_function_with_kafka_disabled(
-        self, mock_kafka_config, mock_publisher
+        self, mock_kafka_config, publishers
     ):
         """Test the main process_zombies function with Kafka disabled."""
         mock_kafka_config.return_value = {
@@ -269,7 +239,7 @@ class TestKafkaIntegration:
             "topic_prefix": "zombie-detector",
         }
 
-        # Create temporary test files
+        # Test inputs, passed in already parsed
         example_data = [
             {
                 "dynatrace_host_id": "HOST-TEST",
@@ -284,27 +254,14 @@ class TestKafkaIntegration:
 
         states_config = {"1A": 1, "0": 0}
 
-        with tempfile.NamedTemporaryFile(mode="w", suffix=".json", delete=False) as f:
-            json.dump(example_data, f)
-            data_path = f.name
+        results = process_zombies(hosts=example_data, state_map=states_config)
 
-        with tempfile.NamedTemporaryFile(mode="w", suffix=".json", delete=False) as f:
-            json.dump(states_config, f)
-            state_path = f.name
-
-        try:
-            results = process_zombies(data_path, state_path)
-
-            assert len(results) == 1
-            assert results[0]["criterion_type"] == "1A"
-            assert results[0]["is_zombie"] == True
-
-            # Verify Kafka publisher was not called when disabled
-            mock_publisher.assert_not_called()
+        assert len(results) == 1
+        assert results[0]["criterion_type"] == "1A"
+        assert results[0]["is_zombie"] == True
 
-        finally:
-            os.unlink(data_path)
-            os.unlink(state_path)
+        # Verify Kafka publisher was not called when disabled
+        assert publishers == []
 
     @patch("zombie_detector.core.processor.ZombieKafkaPublisher")
     @patch("zombie_detector.core.processor._load_kafka_config")
@@ -321,7 +278,7 @@ class TestKafkaIntegration:
         # Mock Kafka publisher to raise an exception
         mock_publisher.side_effect = Exception("Kafka connection failed")
 
-        # Create temporary test files
+        # Test inputs, passed in already parsed
         example_data = [
             {
                 "dynatrace_host_id": "HOST-TEST",
@@ -336,26 +293,13 @@ class TestKafkaIntegration:
 
         states_config = {"1A": 1, "0": 0}
 
-        with tempfile.NamedTemporaryFile(mode="w", suffix=".json", delete=False) as f:
-            json.dump(example_data, f)
-            data_path = f.name
-
-        with tempfile.NamedTemporaryFile(mode="w", suffix=".json", delete=False) as f:
-            json.dump(states_config, f)
-            state_path = f.name
-
-        try:
-            # Should not raise exception even with Kafka error
-            results = process_zombies(data_path, state_path)
+        # Should not raise exception even with Kafka error
+        results = process_zombies(hosts=example_data, state_map=states_config)
 
-            # Processing should continue despite Kafka error
-            assert len(results) == 1
-            assert results[0]["criterion_type"] == "1A"
-            assert results[0]["is_zombie"] == True
-
-        finally:
-            os.unlink(data_path)
-            os.unlink(state_path)
+        # Processing should continue despite Kafka error
+        assert len(results) == 1
+        assert results[0]["criterion_type"] == "1A"
+        assert results[0]["is_zombie"] == True
 
     def test_process_host_data_direct_integration(self):
         """Test direct integration without mocking using process_host_data."""
@@ -383,10 +327,9 @@ class TestKafkaIntegration:
         assert results[0]["is_zombie"] == True
         assert results[0]["dynatrace_host_id"] == "HOST-1"
 
-    @patch("zombie_detector.core.processor.ZombieKafkaPublisher")
     @patch("zombie_detector.core.processor._load_kafka_config")
     def test_integration_with_all_zombie_types(
-        self, mock_kafka_config, mock_publisher, states_config
+        self, mock_kafka_config, publishers, states_config
     ):
         """Test integration with various zombie types."""
         mock_kafka_config.return_value = {
@@ -395,9 +338,6 @@ class TestKafkaIntegration:
             "topic_prefix": "zombie-detector",
         }
 
-        mock_publisher_instance = Mock()
-        mock_publisher.return_value = mock_publisher_instance
-
         # Create test data for different zombie types
         test_data = [
             # Single criteria - 1A
@@ -447,41 +387,34 @@ class TestKafkaIntegration:
         assert len(results) == 4
 
         # Verify specific zombie types
-        host_1a = next(r for r in results if r["dynatrace_host_id"] == "HOST-1A")
+        by_id = _by_id(results)
+        host_1a = by_id["HOST-1A"]
         assert host_1a["criterion_type"] == "1A"
         assert host_1a["criterion_alias"] == "Zombie"
         assert host_1a["is_zombie"] == True
 
-        host_2a = next(r for r in results if r["dynatrace_host_id"] == "HOST-2A")
+        host_2a = by_id["HOST-2A"]
         assert host_2a["criterion_type"] == "2A"
         assert host_2a["criterion_alias"] == "Mummy"
         assert host_2a["is_zombie"] == True
 
-        host_3a = next(r for r in results if r["dynatrace_host_id"] == "HOST-3A")
+        host_3a = by_id["HOST-3A"]
         assert host_3a["criterion_type"] == "3A"
         assert host_3a["criterion_alias"] == "Solomon"
         assert host_3a["is_zombie"] == True
 
-        host_0 = next(r for r in results if r["dynatrace_host_id"] == "HOST-0")
+        host_0 = by_id["HOST-0"]
         assert host_0["criterion_type"] == "0"
         assert host_0["criterion_alias"] == "No Zombie Detected"
         assert host_0["is_zombie"] == False
 
         # Verify Kafka publisher was called
-        mock_publisher.assert_called_once_with(
-            bootstrap_servers="localhost:9092",
-            topic_prefix="zombie-detector",
-            security_protocol="PLAINTEXT",
-            ssl_config=None,
-            sasl_config=None,
-        )
+        (publisher,) = publishers
+        assert publisher.kwargs == _EXPECTED_KAFKA_CALL
 
         # Verify detection results were published
-        mock_publisher_instance.publish_zombie_detection.assert_called_once()
-        published_results = mock_publisher_instance.publish_zombie_detection.call_args[
-            0
-        ][0]
+        (published_results,) = publisher.detections
         assert len(published_results) == 4
 
         # Verify close was called
-        mock_publisher_instance.close.assert_called_once()
+        assert publisher.closed
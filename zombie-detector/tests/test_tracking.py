@@ -2,7 +2,9 @@ import pytest
 import json
 import tempfile
 import os
+import time
 from datetime import datetime, timedelta
+from unittest.mock import patch
 from zombie_detector.core.zombie_tracker import ZombieTracker
 
 
@@ -101,6 +103,142 @@ class TestZombieTracking:
             assert len(killed_zombies) == 1
             assert killed_zombies[0]["dynatrace_host_id"] == "HOST-1"
 
+    def test_legacy_history_with_nan_is_kept(self):
+        """Test that NaN literals in a state file do not reset its history."""
+
+        with tempfile.TemporaryDirectory() as temp_dir:
+            tracker = ZombieTracker(temp_dir)
+            with open(tracker.zombie_history_file, "w") as f:
+                f.write(
+                    '{"history": [{"timestamp": "2024-01-01T00:00:00", '
+                    '"zombie_count": 1, "zombies": [{"dynatrace_host_id": "H0", '
+                    '"Sustained_Low_CPU_criterion": NaN}]}]}'
+                )
+
+            tracker.save_current_zombies([{"dynatrace_host_id": "H1"}])
+
+            with open(tracker.zombie_history_file) as f:
+                history = json.load(f)["history"]
+
+        ids = [entry["zombies"][0]["dynatrace_host_id"] for entry in history]
+        assert ids == ["H0", "H1"]
+
+    def test_concurrent_writers_use_distinct_temp_files(self):
+        """Test that two trackers on one directory never share a temp file."""
+
+        with tempfile.TemporaryDirectory() as temp_dir:
+            first = ZombieTracker(temp_dir)
+            second = ZombieTracker(temp_dir)
+            real_replace = os.replace
+            sources = []
+
+            def replace_after_other_writer(src, dst):
+                sources.append(src)
+                if len(sources) == 1:
+                    # The other tracker writes the same file mid-way
+                    second._write_json(first.current_zombies_file, {"zombies": []})
+                real_replace(src, dst)
+
+            with patch(
+                "zombie_detector.core.zombie_tracker.os.replace",
+                side_effect=replace_after_other_writer,
+            ):
+                first._write_json(first.current_zombies_file, {"zombies": [1]})
+
+            with open(first.current_zombies_file) as f:
+                assert json.load(f) == {"zombies": [1]}
+            leftovers = [name for name in os.listdir(temp_dir) if name.endswith(".tmp")]
+
+        assert len(set(sources)) == 2
+        assert leftovers == []
+
+    def test_large_zombie_diff_is_correct(self):
+        """Test that diffing 10k previous against 10k current zombies is correct."""
+
+        def make_zombies(ids):
+            return [
+                {"dynatrace_host_id": f"HOST-{i}", "hostname": f"hostname{i}"}
+                for i in ids
+            ]
+
+        previous = make_zombies(range(10000))
+        current = make_zombies(range(5000, 15000))
+
+        with tempfile.TemporaryDirectory() as temp_dir:
+            tracker = ZombieTracker(temp_dir)
+
+            # Only run the diff, not the JSON files written around it
+            with (
+                patch.object(tracker, "_load_current_zombies", return_value=previous),
+                patch.object(tracker, "_update_zombie_history"),
+                patch.object(tracker, "_track_killed_zombies"),
+                patch.object(tracker, "_write_json"),
+            ):
+                tracking_info = tracker.save_current_zombies(current)
+
+        assert tracking_info["stats"]["new_zombies"] == 5000
+        assert tracking_info["stats"]["persisting_zombies"] == 5000
+        assert tracking_info["stats"]["killed_zombies"] == 5000
+        assert "HOST-14999" in tracking_info["new_zombies"]
+        assert "HOST-0" in tracking_info["killed_zombies"]
+
+    def test_current_zombie_ids_are_sorted_on_disk(self):
+        """Test that the stored zombie ids are written in sorted order."""
+
+        with tempfile.TemporaryDirectory() as temp_dir:
+            tracker = ZombieTracker(temp_dir)
+            tracker.save_current_zombies(
+                [{"dynatrace_host_id": f"HOST-{i}"} for i in (3, 1, 2)]
+            )
+
+            with open(tracker.current_zombies_file) as f:
+                data = json.load(f)
+
+        assert data["zombie_ids"] == ["HOST-1", "HOST-2", "HOST-3"]
+
+    def test_state_files_are_cached_until_modified(self):
+        """Test that state files are only re-read when changed on disk."""
+
+        with tempfile.TemporaryDirectory() as temp_dir:
+            tracker = ZombieTracker(temp_dir)
+            tracker.save_current_zombies(
+                [{"dynatrace_host_id": "HOST-1", "hostname": "hostname1"}]
+            )
+            assert not [name for name in os.listdir(temp_dir) if name.endswith(".tmp")]
+
+            # Our own write is already cached, so no file is opened
+            with patch("builtins.open") as mock_open:
+                current = tracker._load_current_zombies()
+            mock_open.assert_not_called()
+            assert current[0]["dynatrace_host_id"] == "HOST-1"
+
+            # Another process rewriting the file invalidates the cached copy
+            with open(tracker.current_zombies_file, "w") as f:
+                json.dump({"zombies": [{"dynatrace_host_id": "HOST-2"}]}, f)
+            os.utime(tracker.current_zombies_file, ns=(0, 0))
+
+            current = tracker._load_current_zombies()
+            assert current[0]["dynatrace_host_id"] == "HOST-2"
+
+    def test_caller_changes_do_not_leak_into_cached_state(self):
+        """Test that mutating saved or loaded data does not alter the next diff."""
+
+        with tempfile.TemporaryDirectory() as temp_dir:
+            tracker = ZombieTracker(temp_dir)
+
+            zombies = [{"dynatrace_host_id": "H1"}]
+            tracker.save_current_zombies(zombies)
+
+            # The caller keeps using its own list and what it read back
+            zombies.append({"dynatrace_host_id": "H2"})
+            tracker._load_current_zombies().append({"dynatrace_host_id": "H3"})
+
+            tracking_info = tracker.save_current_zombies(zombies)
+
+        assert tracking_info["new_zombies"] == ["H2"]
+        assert tracking_info["persisting_zombies"] == ["H1"]
+        assert tracking_info["killed_zombies"] == []
+
     def test_zombie_lifecycle_tracking(self):
         """Test zombie lifecycle tracking."""
 
@@ -159,3 +297,27 @@ class TestZombieTracking:
             # Check that data was cleaned
             killed_zombies = tracker.get_killed_zombies(24)
             assert len(killed_zombies) == 0
+
+    def test_cleanup_old_data_keeps_recent_data_untouched(self):
+        """Test that cleanup skips rewrites and removes only stale temp files."""
+
+        with tempfile.TemporaryDirectory() as temp_dir:
+            tracker = ZombieTracker(temp_dir)
+            tracker.save_current_zombies([{"dynatrace_host_id": "HOST-1"}])
+            tracker.save_current_zombies([])  # Kill it
+
+            stale_tmp = os.path.join(temp_dir, "zombie_history.json.tmp")
+            active_tmp = os.path.join(temp_dir, "zombie_history.json.a1b2c3.tmp")
+            for tmp_path in (stale_tmp, active_tmp):
+                with open(tmp_path, "w") as f:
+                    f.write("{")
+            two_hours_ago = time.time() - 2 * 3600
+            os.utime(stale_tmp, (two_hours_ago, two_hours_ago))
+
+            with patch.object(tracker, "_write_json") as mock_write:
+                tracker.cleanup_old_data(30)
+
+            mock_write.assert_not_called()
+            assert not os.path.exists(stale_tmp)
+            assert os.path.exists(active_tmp)
+            assert len(tracker.get_killed_zombies(24)) == 1
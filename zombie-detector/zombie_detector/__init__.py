@@ -1,17 +1,21 @@
-import json
-from .core.classifier import classify_host
+from .core.classifier import VALID_CRITERION_TYPES, classify_host
 from .core.state_loader import load_criterion_type_states
 from .core.processor import process_host_data
+from .utils.utils import iter_host_data
 
 
-def process_zombies(data_path, state_path):
+def process_zombies(data_path=None, state_path=None, *, hosts=None, state_map=None):
     """
     Main function to process zombie detection on host data.
+    Already-parsed hosts/state_map can be passed instead of the file paths.
     """
-    with open(data_path) as f:
-        hosts = json.load(f)
+    if hosts is None:
+        # Files of STREAM_MIN_BYTES or more are streamed when ijson is installed;
+        # smaller files (or any file without ijson) are loaded in one go
+        hosts = iter_host_data(data_path)
 
-    state_map = load_criterion_type_states(state_path)
+    if state_map is None:
+        state_map = load_criterion_type_states(state_path)
 
     # Use the processor function for consistency
     enriched = process_host_data(hosts, state_map)
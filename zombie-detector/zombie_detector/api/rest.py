@@ -9,6 +9,7 @@ import json
 import os
 from zombie_detector import process_zombies
 from ..core.processor import (
+    DEFAULT_STATE_MAP,
     filter_zombies,
     get_zombie_summary,
     get_killed_zombies_summary,
@@ -161,43 +162,7 @@ async def detect_zombies(request: DetectionRequest):
         with tempfile.NamedTemporaryFile(
             mode="w", suffix=".json", delete=False
         ) as states_file:
-            # FIXED: Use the real criterion codes from your classifier
-            default_states = {
-                "0": 0,  # No zombie
-                "1A": 1,
-                "1B": 1,
-                "1C": 1,
-                "1D": 1,
-                "1E": 1,  # Single criteria
-                "2A": 1,
-                "2B": 1,
-                "2C": 1,
-                "2D": 1,
-                "2E": 1,  # Double criteria
-                "2F": 1,
-                "2G": 1,
-                "2H": 1,
-                "2I": 1,
-                "2J": 1,
-                "3A": 1,
-                "3B": 1,
-                "3C": 1,
-                "3D": 1,
-                "3E": 1,  # Triple criteria
-                "3F": 1,
-                "3G": 1,
-                "3H": 1,
-                "3I": 1,
-                "3J": 1,
-                "4A": 1,
-                "4B": 1,
-                "4C": 1,
-                "4D": 1,
-                "4E": 1,  # Quadruple criteria
-                "5": 1,  # All five criteria
-            }
-
-            final_states = {**default_states, **states}
+            final_states = {**DEFAULT_STATE_MAP, **states}
             json.dump(final_states, states_file)
             states_file_path = states_file.name
 
@@ -237,42 +202,7 @@ async def health_check():
 @app.get("/api/v1/states", response_model=StatesResponse)
 async def get_default_states():
     """Get default criterion states configuration."""
-    # FIXED: Return the real criterion codes
-    default_states = {
-        "0": 0,  # No zombie detected
-        "1A": 1,
-        "1B": 1,
-        "1C": 1,
-        "1D": 1,
-        "1E": 1,  # Single criteria zombies
-        "2A": 1,
-        "2B": 1,
-        "2C": 1,
-        "2D": 1,
-        "2E": 1,  # Double criteria zombies
-        "2F": 1,
-        "2G": 1,
-        "2H": 1,
-        "2I": 1,
-        "2J": 1,
-        "3A": 1,
-        "3B": 1,
-        "3C": 1,
-        "3D": 1,
-        "3E": 1,  # Triple criteria zombies
-        "3F": 1,
-        "3G": 1,
-        "3H": 1,
-        "3I": 1,
-        "3J": 1,
-        "4A": 1,
-        "4B": 1,
-        "4C": 1,
-        "4D": 1,
-        "4E": 1,  # Quadruple criteria zombies
-        "5": 1,  # All five criteria active
-    }
-    return StatesResponse(states=default_states)
+    return StatesResponse(states=dict(DEFAULT_STATE_MAP))
 
 
 @app.get("/api/v1/criteria", response_model=CriteriaResponse)
@@ -57,6 +57,9 @@ ALIAS_BY_CODE: Dict[str, str] = {
     "0": "No Zombie Detected",
 }
 
+# Every criterion code the classifier can emit ("0" plus the 31 zombie codes)
+VALID_CRITERION_TYPES: FrozenSet[str] = frozenset(ALIAS_BY_CODE)
+
 # ======= Combination → code mapping rules =======
 # We map *which* criteria are active to a code.
 # We use deterministic lexicographic schemes that match the sheet’s counts and ordering.
@@ -114,22 +117,6 @@ ONE_INDEX_TO_CODE: Dict[int, str] = {
 }
 
 
-def _active_indices(host: Dict) -> List[int]:
-    """
-    Return indices (0..4) of criteria that are active (==1).
-    Treat 0 and -1 as not active.
-    """
-    active = []
-    for i, key in enumerate(CRITERIA_KEYS):
-        try:
-            if int(host.get(key, 0)) == 1:
-                active.append(i)
-        except Exception:
-            # Non-int or missing values are treated as not active
-            pass
-    return active
-
-
 def _code_for_active(active_idxs: List[int]) -> str:
     n = len(active_idxs)
     if n == 5:
@@ -158,6 +145,41 @@ def _description_for_active(active_idxs: List[int]) -> str:
     return ", ".join(parts) if parts else "Sin criterios de zombie activos"
 
 
+def criteria_mask(host: Dict) -> int:
+    """
+    Return the active criteria as a 5-bit mask (bit i set when criterion i == 1).
+    """
+    mask = 0
+    for bit, key in enumerate(CRITERIA_KEYS):
+        try:
+            if int(host.get(key, 0)) == 1:
+                mask |= 1 << bit
+        except Exception:
+            # Non-int or missing values are treated as not active
+            pass
+    return mask
+
+
+def _classification_for_mask(mask: int) -> Tuple[str, str, str]:
+    active = [i for i in range(len(CRITERIA_KEYS)) if mask >> i & 1]
+    code = _code_for_active(active)
+    return code, _alias_for_code(code), _description_for_active(active)
+
+
+# Only 2**5 criteria combinations exist, so classify them all once up front
+_CLASSIFICATION_BY_MASK: Tuple[Tuple[str, str, str], ...] = tuple(
+    _classification_for_mask(mask) for mask in range(1 << len(CRITERIA_KEYS))
+)
+
+
+def classify_mask(mask: int) -> Tuple[str, str, str]:
+    """
+    Return (criterion_code, criterion_alias, criterion_description) for a
+    criteria mask as produced by criteria_mask().
+    """
+    return _CLASSIFICATION_BY_MASK[mask]
+
+
 def classify_host(host: Dict) -> Tuple[str, str, str]:
     """
     Classify a host to the real Excel codes and return:
@@ -172,11 +194,7 @@ def classify_host(host: Dict) -> Tuple[str, str, str]:
         - alias: Human-readable name like "Ghoul", "Wraith", etc.
         - description: Spanish description of active criteria
     """
-    active = _active_indices(host)
-    code = _code_for_active(active)
-    alias = _alias_for_code(code)
-    description = _description_for_active(active)
-    return code, alias, description
+    return classify_mask(criteria_mask(host))
 
 
 def get_all_zombie_types() -> Dict[str, str]:
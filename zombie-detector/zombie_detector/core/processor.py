@@ -1,16 +1,64 @@
 import json
 import configparser
+import functools
 import os
-from typing import List, Dict, Any, Optional
+from types import MappingProxyType
+from typing import Iterable, List, Dict, Any, Mapping, Optional, Tuple
+from .classifier import CRITERIA_KEYS, classify_mask, criteria_mask
 from .zombie_tracker import ZombieTracker
-from .zombie_publisher import ZombieKafkaPublisher
+from .zombie_publisher import DEFAULT_BATCH_SIZE, ZombieKafkaPublisher
 import logging
 
 logger = logging.getLogger(__name__)
 
+# Default criterion states: every combination is a zombie except "0".
+# Read-only so callers share one instance instead of rebuilding it.
+DEFAULT_STATE_MAP: Mapping[str, int] = MappingProxyType(
+    {
+        "0": 0,  # No zombie
+        "1A": 1,
+        "1B": 1,
+        "1C": 1,
+        "1D": 1,
+        "1E": 1,  # Single criteria
+        "2A": 1,
+        "2B": 1,
+        "2C": 1,
+        "2D": 1,
+        "2E": 1,  # Double criteria
+        "2F": 1,
+        "2G": 1,
+        "2H": 1,
+        "2I": 1,
+        "2J": 1,
+        "3A": 1,
+        "3B": 1,
+        "3C": 1,
+        "3D": 1,
+        "3E": 1,  # Triple criteria
+        "3F": 1,
+        "3G": 1,
+        "3H": 1,
+        "3I": 1,
+        "3J": 1,
+        "4A": 1,
+        "4B": 1,
+        "4C": 1,
+        "4D": 1,
+        "4E": 1,  # Quadruple criteria
+        "5": 1,  # All five criteria
+    }
+)
+
 
+@functools.lru_cache(maxsize=1)
 def _load_kafka_config() -> Dict[str, Any]:
-    """Load enhanced Kafka configuration with authentication and SSL support."""
+    """Load enhanced Kafka configuration with authentication and SSL support.
+
+    The file is read once per process and the same dict is returned on every
+    call, so callers must not modify it. Use ``_load_kafka_config.cache_clear()``
+    to pick up changes to the config file.
+    """
     config_path = "/etc/zombie-detector/zombie-detector.ini"
     if not os.path.exists(config_path):
         logger.info("Config file not found, using defaults")
@@ -42,7 +90,7 @@ def _load_kafka_config() -> Dict[str, Any]:
             "compression_type": kafka_config.get("compression_type", "gzip"),
             "retries": kafka_config.getint("retries", 3),
             "acks": kafka_config.get("acks", "all"),
-            "batch_size": kafka_config.getint("batch_size", 16384),
+            "batch_size": kafka_config.getint("batch_size", DEFAULT_BATCH_SIZE),
             "linger_ms": kafka_config.getint("linger_ms", 100),
             "buffer_memory": kafka_config.getint("buffer_memory", 33554432),
         }
@@ -107,40 +155,67 @@ def _load_kafka_config() -> Dict[str, Any]:
         return {"enabled": False}
 
 
+def _build_state_lut(
+    states_config: Mapping[str, int],
+) -> Tuple[Tuple[str, str, str, Any, bool], ...]:
+    """
+    Resolve all 32 criteria combinations against the state map up front.
+
+    Each entry is (criterion_type, alias, description, state, is_zombie),
+    indexed by the classifier's criteria mask.
+    """
+    lut = []
+    for mask in range(1 << len(CRITERIA_KEYS)):
+        criterion_type, criterion_alias, description = classify_mask(mask)
+        # Get state for this criterion code
+        criterion_state = states_config.get(criterion_type, 1)
+        if criterion_state == 0:
+            # If the detected zombie type is DISABLED, override to "0"
+            entry = (
+                "0",
+                "No Zombie Detected",
+                "Sin criterios de zombie activos",
+                criterion_state,
+                False,
+            )
+        else:
+            # If enabled, keep the classification
+            entry = (
+                criterion_type,
+                criterion_alias,
+                description,
+                criterion_state,
+                criterion_type != "0",
+            )
+        lut.append(entry)
+    return tuple(lut)
+
+
 def process_host_data(
-    host_data: List[Dict[str, Any]],
+    host_data: Iterable[Dict[str, Any]],
     states_config: Dict[str, int],
     enable_tracking: bool = True,
     enable_kafka: bool = True,
     data_dir: Optional[str] = None,
 ) -> List[Dict[str, Any]]:
     """
-    Process a list of hosts and enrich them with zombie classification data.
-    """
-    from .classifier import classify_host
+    Process hosts and enrich them with zombie classification data.
 
+    ``host_data`` may be any iterable, such as the generator returned by
+    ``iter_host_data``; it is consumed exactly once.
+    """
+    state_lut = _build_state_lut(states_config)
     enriched_hosts = []
 
     for host in host_data:
-        # Step 1: Get the raw classification
-        classification = classify_host(host)
-        if isinstance(classification, tuple):
-            criterion_type, criterion_alias, description = classification
-        else:
-            criterion_type = classification
-            criterion_alias = "Unknown"
-            description = ""
-        # Get state for this criterion code
-        criterion_state = states_config.get(criterion_type, 1)
-        if criterion_state == 0:
-            # If the detected zombie type is DISABLED, override to "0"
-            criterion_type = "0"
-            criterion_alias = "No Zombie Detected"
-            description = "Sin criterios de zombie activos"
-            is_zombie = False
-        else:
-            # If enabled, keep the classification
-            is_zombie = criterion_type != "0"
+        # Classification and state only depend on the 5-bit criteria mask
+        (
+            criterion_type,
+            criterion_alias,
+            description,
+            criterion_state,
+            is_zombie,
+        ) = state_lut[criteria_mask(host)]
 
         # Enrich host data
         enriched_host = host.copy()
@@ -210,15 +285,13 @@ def process_host_data(
                 if tracking_info:
                     kafka_publisher.publish_tracking_stats(tracking_info)
 
+                    # One pass over the hosts instead of one scan per new
+                    # zombie; reversed so the first duplicate id wins
+                    hosts_by_id = {
+                        h["dynatrace_host_id"]: h for h in reversed(enriched_hosts)
+                    }
                     for zombie_id in tracking_info.get("new_zombies", []):
-                        zombie_data = next(
-                            (
-                                h
-                                for h in enriched_hosts
-                                if h["dynatrace_host_id"] == zombie_id
-                            ),
-                            None,
-                        )
+                        zombie_data = hosts_by_id.get(zombie_id)
                         if zombie_data:
                             kafka_publisher.publish_zombie_lifecycle_event(
                                 "zombie_new", zombie_data
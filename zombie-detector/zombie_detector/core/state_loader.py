@@ -1,5 +1,34 @@
 import json
 import os
+from functools import lru_cache
+from types import MappingProxyType
+
+# Fallback states, read-only because every caller shares this instance
+DEFAULT_CRITERION_TYPE_STATES = MappingProxyType(
+    {
+        "T1": 1,  # Active
+        "T2": 1,  # Active
+        "T3": 1,  # Active
+        "T4": 1,  # Active
+        "T5": 0,  # Inactive
+        "T6": 0,  # Inactive
+    }
+)
+
+
+@lru_cache(maxsize=16)
+def _load_state_map_cached(state_path, ino, mtime_ns, ctime_ns, size):
+    """
+    Parse a state file once per (path, inode, mtime, ctime, size).
+    Errors propagate, so a failed parse is never cached.
+
+    Replacing the file (as editors and config management do) always changes
+    the inode. A same-size in-place edit that lands within the filesystem's
+    timestamp granularity is not detected and is served stale until the next
+    change.
+    """
+    with open(state_path, "r") as f:
+        return MappingProxyType(json.load(f))
 
 
 def load_criterion_type_states(state_path):
@@ -7,27 +36,19 @@ def load_criterion_type_states(state_path):
     Load criterion type states from a JSON file.
     Returns a mapping of criterion_type -> state value.
     """
-    if not os.path.exists(state_path):
+    try:
+        st = os.stat(state_path)
+    except OSError:
         # Return default states if file doesn't exist
-        return {
-            "T1": 1,  # Active
-            "T2": 1,  # Active
-            "T3": 1,  # Active
-            "T4": 1,  # Active
-            "T5": 0,  # Inactive
-            "T6": 0,  # Inactive
-        }
+        return dict(DEFAULT_CRITERION_TYPE_STATES)
 
     try:
-        with open(state_path, "r") as f:
-            return json.load(f)
+        states = _load_state_map_cached(
+            state_path, st.st_ino, st.st_mtime_ns, st.st_ctime_ns, st.st_size
+        )
     except (json.JSONDecodeError, IOError):
         # Return default states on error
-        return {
-            "T1": 1,
-            "T2": 1,
-            "T3": 1,
-            "T4": 1,
-            "T5": 0,
-            "T6": 0,
-        }
+        return dict(DEFAULT_CRITERION_TYPE_STATES)
+
+    # Hand out a copy; the cached mapping stays shared and read-only
+    return dict(states)
@@ -1,9 +1,40 @@
 import json
 import os
+import tempfile
+import time
 from datetime import datetime, timedelta
 from typing import Dict, List, Set, Optional, Any
 from pathlib import Path
 
+# Temp files younger than this may still belong to a writer in progress
+STALE_TMP_SECONDS = 3600
+
+try:
+    # Optional: several times faster than json for the tracker's state files
+    import orjson
+
+    def _json_loads(raw: bytes) -> Any:
+        try:
+            return orjson.loads(raw)
+        except orjson.JSONDecodeError:
+            # Legacy state files may hold NaN/Infinity, which only json accepts
+            return json.loads(raw)
+
+    def _json_dumps(data: Any) -> bytes:
+        return orjson.dumps(
+            data,
+            default=str,
+            option=orjson.OPT_INDENT_2
+            | orjson.OPT_NON_STR_KEYS
+            | orjson.OPT_PASSTHROUGH_DATETIME,
+        )
+
+except ImportError:
+    _json_loads = json.loads
+
+    def _json_dumps(data: Any) -> bytes:
+        return json.dumps(data, indent=2, default=str).encode()
+
 
 class ZombieTracker:
     """
@@ -16,6 +47,8 @@ class ZombieTracker:
         self.current_zombies_file = self.data_dir / "current_zombies.json"
         self.zombie_history_file = self.data_dir / "zombie_history.json"
         self.killed_zombies_file = self.data_dir / "killed_zombies.json"
+        # path -> ((st_mtime_ns, st_size), file bytes) for the state files
+        self._file_cache: Dict[Path, Any] = {}
 
     def save_current_zombies(self, zombies: List[Dict[str, Any]]) -> Dict[str, Any]:
         """
@@ -38,7 +71,8 @@ class ZombieTracker:
         zombie_data = {
             "timestamp": current_time,
             "zombies": zombies,
-            "zombie_ids": list(current_zombie_ids),
+            # Sorted so the file is stable between runs with the same zombies
+            "zombie_ids": sorted(current_zombie_ids),
             "stats": {
                 "total_zombies": len(zombies),
                 "new_zombies": len(new_zombies),
@@ -47,8 +81,7 @@ class ZombieTracker:
             },
         }
 
-        with open(self.current_zombies_file, "w") as f:
-            json.dump(zombie_data, f, indent=2, default=str)
+        self._write_json(self.current_zombies_file, zombie_data)
 
         self._update_zombie_history(zombies, current_time)
 
@@ -67,8 +100,7 @@ class ZombieTracker:
         Get zombies that were killed within the specified time period.
         """
         try:
-            with open(self.killed_zombies_file, "r") as f:
-                killed_data = json.load(f)
+            killed_data = self._read_json(self.killed_zombies_file)
         except (FileNotFoundError, json.JSONDecodeError):
             return []
 
@@ -87,8 +119,7 @@ class ZombieTracker:
         Check if a specific zombie was killed and return details.
         """
         try:
-            with open(self.killed_zombies_file, "r") as f:
-                killed_data = json.load(f)
+            killed_data = self._read_json(self.killed_zombies_file)
         except (FileNotFoundError, json.JSONDecodeError):
             return None
 
@@ -113,8 +144,7 @@ class ZombieTracker:
         }
 
         try:
-            with open(self.zombie_history_file, "r") as f:
-                history_data = json.load(f)
+            history_data = self._read_json(self.zombie_history_file)
         except (FileNotFoundError, json.JSONDecodeError):
             history_data = {"history": []}
 
@@ -155,54 +185,118 @@ class ZombieTracker:
         """
         cutoff_time = datetime.now() - timedelta(days=days_to_keep)
 
+        # Drop temp files left behind by interrupted atomic writes. Recent ones
+        # are skipped, since another tracker may be about to rename them.
+        stale_before = time.time() - STALE_TMP_SECONDS
+        prefixes = tuple(
+            f"{state_file.name}."
+            for state_file in (
+                self.current_zombies_file,
+                self.zombie_history_file,
+                self.killed_zombies_file,
+            )
+        )
+        with os.scandir(self.data_dir) as entries:
+            for entry in entries:
+                if (
+                    entry.name.startswith(prefixes)
+                    and entry.name.endswith(".tmp")
+                    and entry.is_file()
+                    and entry.stat().st_mtime < stale_before
+                ):
+                    try:
+                        os.unlink(entry.path)
+                    except FileNotFoundError:
+                        pass  # Renamed or removed by its writer meanwhile
+
         # Clean history
         try:
-            with open(self.zombie_history_file, "r") as f:
-                history_data = json.load(f)
+            history_data = self._read_json(self.zombie_history_file)
         except (FileNotFoundError, json.JSONDecodeError):
             return
 
-        filtered_history = []
-        for entry in history_data.get("history", []):
-            entry_time = datetime.fromisoformat(entry["timestamp"])
-            if entry_time >= cutoff_time:
-                filtered_history.append(entry)
+        history = history_data.get("history", [])
+        filtered_history = [
+            entry
+            for entry in history
+            if datetime.fromisoformat(entry["timestamp"]) >= cutoff_time
+        ]
 
-        history_data["history"] = filtered_history
-        with open(self.zombie_history_file, "w") as f:
-            json.dump(history_data, f, indent=2, default=str)
+        # Only rewrite files that actually lost entries
+        if len(filtered_history) != len(history):
+            history_data["history"] = filtered_history
+            self._write_json(self.zombie_history_file, history_data)
 
         # Clean killed zombies
         try:
-            with open(self.killed_zombies_file, "r") as f:
-                killed_data = json.load(f)
+            killed_data = self._read_json(self.killed_zombies_file)
         except (FileNotFoundError, json.JSONDecodeError):
             return
 
-        filtered_killed = []
-        for entry in killed_data.get("killed_zombies", []):
-            killed_time = datetime.fromisoformat(entry["killed_at"])
-            if killed_time >= cutoff_time:
-                filtered_killed.append(entry)
+        killed = killed_data.get("killed_zombies", [])
+        filtered_killed = [
+            entry
+            for entry in killed
+            if datetime.fromisoformat(entry["killed_at"]) >= cutoff_time
+        ]
+
+        if len(filtered_killed) != len(killed):
+            killed_data["killed_zombies"] = filtered_killed
+            self._write_json(self.killed_zombies_file, killed_data)
+
+    def _read_json(self, path: Path) -> Any:
+        """
+        Load a state file, reusing its bytes while the mtime is unchanged.
+        Every call parses a fresh object, so callers may modify the result.
+        """
+        st = os.stat(path)
+        key = (st.st_mtime_ns, st.st_size)
+        cached = self._file_cache.get(path)
+        if cached is not None and cached[0] == key:
+            return _json_loads(cached[1])
+
+        with open(path, "rb") as f:
+            raw = f.read()
+        data = _json_loads(raw)
+        self._file_cache[path] = (key, raw)
+        return data
+
+    def _write_json(self, path: Path, data: Any):
+        """
+        Atomically replace a state file and remember what was written.
+        """
+        # Forget the old copy first, so a failed write forces a re-read
+        self._file_cache.pop(path, None)
+        raw = _json_dumps(data)
+        # A unique temp name per write, so trackers sharing the data
+        # directory never rename each other's half-written files
+        fd, tmp_path = tempfile.mkstemp(
+            dir=path.parent, prefix=path.name + ".", suffix=".tmp"
+        )
+        try:
+            with os.fdopen(fd, "wb") as f:
+                f.write(raw)
+            os.replace(tmp_path, path)
+        except BaseException:
+            os.unlink(tmp_path)
+            raise
 
-        killed_data["killed_zombies"] = filtered_killed
-        with open(self.killed_zombies_file, "w") as f:
-            json.dump(killed_data, f, indent=2, default=str)
+        # Keep the written bytes, not ``data``, which the caller still owns
+        st = os.stat(path)
+        self._file_cache[path] = ((st.st_mtime_ns, st.st_size), raw)
 
     def _load_current_zombies(self) -> List[Dict[str, Any]]:
         """Load current zombies from file."""
         try:
-            with open(self.current_zombies_file, "r") as f:
-                data = json.load(f)
-                return data.get("zombies", [])
+            data = self._read_json(self.current_zombies_file)
+            return data.get("zombies", [])
         except (FileNotFoundError, json.JSONDecodeError):
             return []
 
     def _update_zombie_history(self, zombies: List[Dict[str, Any]], timestamp: str):
         """Update zombie detection history."""
         try:
-            with open(self.zombie_history_file, "r") as f:
-                history_data = json.load(f)
+            history_data = self._read_json(self.zombie_history_file)
         except (FileNotFoundError, json.JSONDecodeError):
             history_data = {"history": []}
 
@@ -219,8 +313,7 @@ class ZombieTracker:
         if len(history_data["history"]) > 1000:
             history_data["history"] = history_data["history"][-1000:]
 
-        with open(self.zombie_history_file, "w") as f:
-            json.dump(history_data, f, indent=2, default=str)
+        self._write_json(self.zombie_history_file, history_data)
 
     def _track_killed_zombies(
         self,
@@ -230,8 +323,7 @@ class ZombieTracker:
     ):
         """Track zombies that were killed."""
         try:
-            with open(self.killed_zombies_file, "r") as f:
-                killed_data = json.load(f)
+            killed_data = self._read_json(self.killed_zombies_file)
         except (FileNotFoundError, json.JSONDecodeError):
             killed_data = {"killed_zombies": []}
 
@@ -248,5 +340,4 @@ class ZombieTracker:
                 }
                 killed_data["killed_zombies"].append(killed_entry)
 
-        with open(self.killed_zombies_file, "w") as f:
-            json.dump(killed_data, f, indent=2, default=str)
+        self._write_json(self.killed_zombies_file, killed_data)
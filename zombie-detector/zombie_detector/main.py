@@ -9,7 +9,12 @@ from .core.processor import (
     get_killed_zombies_summary,
 )
 from .core.zombie_tracker import ZombieTracker
-from .utils.utils import save_results_json, save_results_csv, generate_report_timestamp
+from .utils.utils import (
+    generate_report_timestamp,
+    iter_host_data,
+    save_results_csv,
+    save_results_json,
+)
 
 
 def main():
@@ -128,8 +133,7 @@ def handle_detect_command(args):
             print("Kafka publishing disabled")
 
     # Load data and states
-    with open(args.data_path) as f:
-        hosts = json.load(f)
+    hosts = iter_host_data(args.data_path)
 
     from .core.state_loader import load_criterion_type_states
 
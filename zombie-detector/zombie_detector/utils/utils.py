@@ -1,8 +1,65 @@
 import json
 import csv
-from typing import List, Dict, Any
+import itertools
+import os
+from typing import Iterator, List, Dict, Any
 from datetime import datetime
 
+try:
+    # Optional: much faster parsing of large host dumps
+    import orjson
+
+    def _json_loads(raw: bytes) -> Any:
+        try:
+            return orjson.loads(raw)
+        except orjson.JSONDecodeError:
+            # orjson rejects NaN/Infinity, which json accepts; keep accepting them
+            return json.loads(raw)
+
+except ImportError:
+    _json_loads = json.loads
+
+try:
+    # Optional: stream huge host files instead of parsing them in one go
+    import ijson
+except ImportError:
+    ijson = None
+
+# Files below this size are parsed in one go, which beats streaming for speed
+STREAM_MIN_BYTES = 256 * 1024 * 1024
+
+
+def load_host_data(data_path: str) -> List[Dict[str, Any]]:
+    """
+    Load the host list from a JSON file, using orjson when it is installed.
+    """
+    with open(data_path, "rb") as f:
+        return _json_loads(f.read())
+
+
+def iter_host_data(data_path: str) -> Iterator[Dict[str, Any]]:
+    """
+    Yield the hosts of a JSON array file one by one.
+
+    Files of STREAM_MIN_BYTES or more are streamed with ijson when it is
+    installed, so the raw host list is never held in memory at once. Smaller
+    files, or any file without ijson, go through load_host_data (orjson, then
+    the stdlib json). Raises ValueError if the top-level value is not an array.
+    """
+    if ijson is None or os.path.getsize(data_path) < STREAM_MIN_BYTES:
+        hosts = load_host_data(data_path)
+        if not isinstance(hosts, list):
+            raise ValueError(f"{data_path}: host data must be a JSON array")
+        yield from hosts
+        return
+
+    with open(data_path, "rb") as f:
+        events = ijson.parse(f, use_float=True)
+        first = next(events, None)
+        if first is None or first[1] != "start_array":
+            raise ValueError(f"{data_path}: host data must be a JSON array")
+        yield from ijson.items(itertools.chain([first], events), "item")
+
 
 def save_results_json(data: List[Dict[str, Any]], output_path: str) -> None:
     """